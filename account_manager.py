@@ -9,9 +9,55 @@
 import os
 import json
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from apify_client import ApifyClient
+from scraper_common import get_logger
+
+# Child of the shared "smart_scraper" logger (same stream and SCRAPER_LOG_LEVEL)
+logger = get_logger("smart_scraper.accounts")
+
+# MillionVerifier request pacing: additive increase per success up to the max,
+# halve on 429 (AIMD), so bursts from parallel checks settle at the API limit
+MV_MAX_RPS = float(os.getenv('MILLIONVERIFIER_MAX_RPS', '10'))
+MV_MIN_RPS = 1.0
+
+
+class MillionVerifierRateLimiter:
+    """⏱️ Process-wide AIMD pacing for MillionVerifier requests (thread-safe)"""
+    
+    def __init__(self, max_rps=MV_MAX_RPS, min_rps=MV_MIN_RPS):
+        self.max_rps = max_rps
+        self.min_rps = min_rps
+        self._rps = max_rps
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the next request slot at the current rate"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + 1.0 / self._rps
+        if wait > 0:
+            time.sleep(wait)
+    
+    def record_success(self):
+        with self._lock:
+            self._rps = min(self.max_rps, self._rps + 0.5)
+    
+    def record_rate_limited(self, retry_after):
+        """Halve the rate and hold every caller back for retry_after seconds; returns the new rate"""
+        with self._lock:
+            self._rps = max(self.min_rps, self._rps * 0.5)
+            self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
+            return self._rps
+
+
+# The one limiter every MillionVerifier call goes through
+mv_rate_limiter = MillionVerifierRateLimiter()
 
 
 class MillionVerifierManager:
@@ -22,6 +68,28 @@ class MillionVerifierManager:
         self.credits_cache = None
         self.last_update = None
         
+        # One keep-alive session for every credit check / verification call
+        self.session = requests.Session()
+    
+    def _paced_get(self, url, params, timeout):
+        """⏱️ GET at the current AIMD rate; on 429 halve the rate, honour Retry-After and retry once"""
+        
+        for attempt in range(2):
+            mv_rate_limiter.wait()
+            response = self.session.get(url, params=params, timeout=timeout)
+            
+            if response.status_code != 429:
+                mv_rate_limiter.record_success()
+                return response
+            try:
+                retry_after = float(response.headers.get('Retry-After', 1))
+            except ValueError:
+                retry_after = 1.0
+            rps = mv_rate_limiter.record_rate_limited(retry_after)
+            logger.warning(f"      ⚠️ MillionVerifier rate limited - slowing to {rps:.1f} req/s")
+        
+        return response
+        
     def get_real_time_credits(self):
         """📊 Get real-time MillionVerifier credits with caching"""
         
@@ -36,7 +104,7 @@ class MillionVerifierManager:
             url = "https://api.millionverifier.com/api/v3/credits"
             params = {'api': self.api_key}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self._paced_get(url, params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -45,27 +113,27 @@ class MillionVerifierManager:
                 self.credits_cache = credits
                 self.last_update = now
                 
-                print(f"💳 MillionVerifier Credits: {credits}")
+                logger.info(f"💳 MillionVerifier Credits: {credits}")
                 return credits
             else:
-                print(f"⚠️ MillionVerifier credits API error: {response.status_code}")
+                logger.warning(f"⚠️ MillionVerifier credits API error: {response.status_code}")
                 return self.credits_cache or 0
                 
         except Exception as e:
-            print(f"⚠️ Error checking MillionVerifier credits: {e}")
+            logger.warning(f"⚠️ Error checking MillionVerifier credits: {e}")
             return self.credits_cache or 0
     
     def smart_verify_email(self, email, domain=None):
         """🧠 FIXED: Smart MillionVerifier with real-time credits and catch-all intelligence"""
         
         if not self.api_key:
-            print(f"      ⚠️ MillionVerifier API key not found - assuming valid")
+            logger.warning(f"      ⚠️ MillionVerifier API key not found - assuming valid")
             return True
         
         # Check credits before making API call
         credits_before = self.get_real_time_credits()
         if credits_before < 10:
-            print(f"      ⚠️ Low MillionVerifier credits ({credits_before}) - assuming valid")
+            logger.warning(f"      ⚠️ Low MillionVerifier credits ({credits_before}) - assuming valid")
             return True
         
         try:
@@ -76,8 +144,8 @@ class MillionVerifierManager:
                 'timeout': 10
             }
             
-            print(f"      📡 MillionVerifier checking: {email}")
-            response = requests.get(url, params=params, timeout=30)
+            logger.info(f"      📡 MillionVerifier checking: {email}")
+            response = self._paced_get(url, params, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -90,33 +158,33 @@ class MillionVerifierManager:
                 self.last_update = time.time()
                 
                 credits_used = credits_before - credits_after
-                print(f"      📊 MillionVerifier response: quality='{quality}', result='{result_status}'")
-                print(f"      💳 Credits: {credits_after} (used: {credits_used})")
+                logger.info(f"      📊 MillionVerifier response: quality='{quality}', result='{result_status}'")
+                logger.info(f"      💳 Credits: {credits_after} (used: {credits_used})")
                 
                 # 🧠 SMART LOGIC: Accept ANY email source, not just specific ones
                 if quality == 'good' and result_status in ['ok', 'deliverable']:
-                    print(f"      ✅ MillionVerifier: {email} is valid - ACCEPT")
+                    logger.info(f"      ✅ MillionVerifier: {email} is valid - ACCEPT")
                     return True
                     
                 elif quality == 'risky' and result_status == 'catch_all':
-                    print(f"      ⚠️ MillionVerifier: {email} is on catch-all domain - ACCEPT")
+                    logger.warning(f"      ⚠️ MillionVerifier: {email} is on catch-all domain - ACCEPT")
                     # NEW: Accept ALL emails on catch-all domains
                     return True
                         
                 elif result_status in ['invalid', 'disposable'] or quality == 'bad':
-                    print(f"      ❌ MillionVerifier: {email} is {result_status} - REJECT")
+                    logger.warning(f"      ❌ MillionVerifier: {email} is {result_status} - REJECT")
                     return False
                     
                 else:
-                    print(f"      ⚠️ MillionVerifier: {email} status '{quality}'/'{result_status}' - ACCEPT")
+                    logger.warning(f"      ⚠️ MillionVerifier: {email} status '{quality}'/'{result_status}' - ACCEPT")
                     # NEW: Accept unknown statuses
                     return True
             else:
-                print(f"      ⚠️ MillionVerifier API error: {response.status_code} - assuming valid")
+                logger.warning(f"      ⚠️ MillionVerifier API error: {response.status_code} - assuming valid")
                 return True
                 
         except Exception as e:
-            print(f"      ⚠️ MillionVerifier error for {email}: {e} - assuming valid")
+            logger.warning(f"      ⚠️ MillionVerifier error for {email}: {e} - assuming valid")
             return True
 
 
@@ -154,7 +222,7 @@ class ApifyAccountManager:
                 'active': True
             })
         
-        print(f"📊 Loaded {len(accounts)} Apify accounts for rotation")
+        logger.info(f"📊 Loaded {len(accounts)} Apify accounts for rotation")
         return accounts
     
     def get_real_time_credit_usage(self, account):
@@ -189,8 +257,8 @@ class ApifyAccountManager:
                 monthly_compute_units = current.get("monthlyActorComputeUnits", 0)
                 max_compute_units = limits.get("maxMonthlyActorComputeUnits", 625)
                 
-                print(f"   💰 {account['name']}: ${monthly_usage_usd:.3f}/${max_monthly_usd} (${remaining_usd:.3f} remaining)")
-                print(f"      📅 Monthly cost: ${monthly_usage_usd:.3f}")
+                logger.info(f"   💰 {account['name']}: ${monthly_usage_usd:.3f}/${max_monthly_usd} (${remaining_usd:.3f} remaining)")
+                logger.info(f"      📅 Monthly cost: ${monthly_usage_usd:.3f}")
                 
                 return {
                     'used': round(monthly_usage_usd, 3),
@@ -202,21 +270,33 @@ class ApifyAccountManager:
                 }
                 
         except (HTTPError, URLError, Exception) as e:
-            print(f"   ⚠️ Real-time credit check failed for {account['name']}: {e}")
+            logger.warning(f"   ⚠️ Real-time credit check failed for {account['name']}: {e}")
             return None
     
+    def get_real_time_credit_usage_all(self):
+        """⚡ Check credits for every active account concurrently (independent HTTP calls)"""
+        
+        active = [a for a in self.accounts if a['active']]
+        if not active:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(active), 10)) as pool:
+            results = pool.map(self.get_real_time_credit_usage, active)
+            return {account['id']: credits for account, credits in zip(active, results)}
+    
     def get_best_account_part1(self, credit_threshold=4.85):
         """Get best account for Part 1 with REAL-TIME credit monitoring and threshold switching"""
-        print(f"🔍 Part 1: Checking accounts for credit availability (threshold: ${credit_threshold})...")
+        logger.info(f"🔍 Part 1: Checking accounts for credit availability (threshold: ${credit_threshold})...")
         
         available_accounts = []
+        credits_by_account = self.get_real_time_credit_usage_all()
         
         for account in self.accounts:
             if not account['active']:
                 continue
             
-            # Get real-time credit usage using FIXED method
-            real_time_credits = self.get_real_time_credit_usage(account)
+            # Real-time credit usage (fetched for all accounts in parallel above)
+            real_time_credits = credits_by_account.get(account['id'])
             
             if real_time_credits:
                 remaining = real_time_credits['remaining']
@@ -226,7 +306,7 @@ class ApifyAccountManager:
                 # Check if account has enough credits above threshold
                 threshold_remaining = limit - credit_threshold
                 if remaining <= threshold_remaining:
-                    print(f"   ⚠️ {account['name']}: Below threshold (${remaining} <= ${threshold_remaining}), skipping")
+                    logger.warning(f"   ⚠️ {account['name']}: Below threshold (${remaining} <= ${threshold_remaining}), skipping")
                     continue
                 
                 # Test if account is working
@@ -236,21 +316,21 @@ class ApifyAccountManager:
                         'credits': real_time_credits,
                         'remaining': remaining
                     })
-                    print(f"   ✅ {account['name']}: Available (${remaining} remaining, above ${credit_threshold} threshold)")
+                    logger.info(f"   ✅ {account['name']}: Available (${remaining} remaining, above ${credit_threshold} threshold)")
                 else:
-                    print(f"   ❌ {account['name']}: Not responding")
+                    logger.error(f"   ❌ {account['name']}: Not responding")
             else:
-                print(f"   ❌ {account['name']}: Could not check credits")
+                logger.error(f"   ❌ {account['name']}: Could not check credits")
         
         if not available_accounts:
-            print(f"❌ No accounts with credits above ${credit_threshold} threshold found!")
+            logger.error(f"❌ No accounts with credits above ${credit_threshold} threshold found!")
             return None
         
         # Sort by most credits remaining
         available_accounts.sort(key=lambda x: x['remaining'], reverse=True)
         best = available_accounts[0]
         
-        print(f"🎯 Part 1 Selected: {best['account']['name']} (${best['remaining']} remaining)")
+        logger.info(f"🎯 Part 1 Selected: {best['account']['name']} (${best['remaining']} remaining)")
         
         # Log detailed usage for monitoring
         self._log_credit_usage(best['account'], best['credits'])
@@ -259,16 +339,17 @@ class ApifyAccountManager:
     
     def get_best_account_part2(self, credit_threshold=4.85):
         """🔧 FIXED: Get best account for Part 2 (LinkedIn) with REAL-TIME credit monitoring"""
-        print(f"🔍 Part 2: Checking accounts for LinkedIn scraping (threshold: ${credit_threshold})...")
+        logger.info(f"🔍 Part 2: Checking accounts for LinkedIn scraping (threshold: ${credit_threshold})...")
         
         available_accounts = []
+        credits_by_account = self.get_real_time_credit_usage_all()
         
         for account in self.accounts:
             if not account['active']:
                 continue
             
-            # Get real-time credit usage using FIXED method
-            real_time_credits = self.get_real_time_credit_usage(account)
+            # Real-time credit usage (fetched for all accounts in parallel above)
+            real_time_credits = credits_by_account.get(account['id'])
             
             if real_time_credits:
                 remaining = real_time_credits['remaining']
@@ -278,7 +359,7 @@ class ApifyAccountManager:
                 # Check if account has enough credits above threshold
                 threshold_remaining = limit - credit_threshold
                 if remaining <= threshold_remaining:
-                    print(f"   ⚠️ {account['name']}: Below threshold (${remaining} <= ${threshold_remaining}), skipping")
+                    logger.warning(f"   ⚠️ {account['name']}: Below threshold (${remaining} <= ${threshold_remaining}), skipping")
                     continue
                 
                 # Test if account is working
@@ -288,21 +369,21 @@ class ApifyAccountManager:
                         'credits': real_time_credits,
                         'remaining': remaining
                     })
-                    print(f"   ✅ {account['name']}: Available for Part 2 (${remaining} remaining)")
+                    logger.info(f"   ✅ {account['name']}: Available for Part 2 (${remaining} remaining)")
                 else:
-                    print(f"   ❌ {account['name']}: Not responding")
+                    logger.error(f"   ❌ {account['name']}: Not responding")
             else:
-                print(f"   ❌ {account['name']}: Could not check credits")
+                logger.error(f"   ❌ {account['name']}: Could not check credits")
         
         if not available_accounts:
-            print(f"❌ No accounts with credits above ${credit_threshold} threshold found for Part 2!")
+            logger.error(f"❌ No accounts with credits above ${credit_threshold} threshold found for Part 2!")
             return None
         
         # Sort by most credits remaining
         available_accounts.sort(key=lambda x: x['remaining'], reverse=True)
         best = available_accounts[0]
         
-        print(f"🎯 Part 2 Selected: {best['account']['name']} (${best['remaining']} remaining)")
+        logger.info(f"🎯 Part 2 Selected: {best['account']['name']} (${best['remaining']} remaining)")
         
         # Log detailed usage for monitoring
         self._log_credit_usage(best['account'], best['credits'])
@@ -315,10 +396,10 @@ class ApifyAccountManager:
             if os.path.exists(self.usage_file):
                 with open(self.usage_file, 'r') as f:
                     data = json.load(f)
-                print(f"📈 Loaded usage data for {len(data)} accounts")
+                logger.info(f"📈 Loaded usage data for {len(data)} accounts")
                 return data
         except Exception as e:
-            print(f"⚠️ Error loading usage data: {e}")
+            logger.warning(f"⚠️ Error loading usage data: {e}")
         
         # Initialize empty usage data
         return {str(acc['id']): {'runs_used': 0, 'runs_limit': 8, 'last_reset': datetime.now().strftime('%Y-%m')} 
@@ -331,7 +412,7 @@ class ApifyAccountManager:
             with open(self.usage_file, 'w') as f:
                 json.dump(self.usage_data, f, indent=2)
         except Exception as e:
-            print(f"⚠️ Error saving usage data: {e}")
+            logger.warning(f"⚠️ Error saving usage data: {e}")
     
     def test_account_working(self, account):
         """Simple test to see if account is working"""
@@ -348,7 +429,7 @@ class ApifyAccountManager:
             if "limit exceeded" in error_msg or "free user" in error_msg:
                 return False  # Account exhausted
             else:
-                print(f"   ⚠️ {account['name']}: API Error - {e}")
+                logger.warning(f"   ⚠️ {account['name']}: API Error - {e}")
                 return False
     
     def record_usage(self, account, success=True):
@@ -360,7 +441,7 @@ class ApifyAccountManager:
         
         if success:
             self.usage_data[account_id]['runs_used'] += 1
-            print(f"📊 {account['name']}: Updated LinkedIn calls to {self.usage_data[account_id]['runs_used']}/{self.usage_data[account_id]['runs_limit']}")
+            logger.info(f"📊 {account['name']}: Updated LinkedIn calls to {self.usage_data[account_id]['runs_used']}/{self.usage_data[account_id]['runs_limit']}")
         
         self.save_usage_data()
     
@@ -398,7 +479,7 @@ class ApifyAccountManager:
                 json.dump(log_data, f, indent=2)
                 
         except Exception as e:
-            print(f"   ⚠️ Could not log credit usage: {e}")
+            logger.warning(f"   ⚠️ Could not log credit usage: {e}")
     
     def get_client_part1(self):
         """Get working Apify client for Part 1 (credit-based)"""
@@ -427,6 +508,66 @@ class ApifyAccountManager:
         return client
 
 
+class ApifyCircuitBreaker:
+    """⚡ Stop launching Apify runs after repeated failures, retry after a cooldown"""
+    
+    def __init__(self, fail_max=5, reset_timeout=60):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None  # set while the single half-open trial is in flight
+        self._lock = threading.Lock()
+    
+    def get_state(self):
+        """📊 closed (normal), open (skip Apify) or half-open (allow one trial run)"""
+        
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.time() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+    
+    def allow(self):
+        """🚦 True when a run may start; half-open lets exactly one trial through"""
+        
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.time()
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            # Half-open: one trial at a time; a trial that never reported back
+            # frees the slot after another cooldown
+            if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                return False
+            self._probe_started = now
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probe_started = None
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_started = None
+            if self.failures >= self.fail_max or self.opened_at is not None:
+                # Trip (or re-trip after a failed half-open trial)
+                self.opened_at = time.time()
+                logger.warning(f"⚡ Apify circuit OPEN after {self.failures} failures - skipping runs for {self.reset_timeout}s")
+
+
+# Shared by every Apify caller in the process
+apify_breaker = ApifyCircuitBreaker(
+    fail_max=int(os.getenv('APIFY_BREAKER_FAIL_MAX', '5')),
+    reset_timeout=int(os.getenv('APIFY_BREAKER_RESET_SECS', '60'))
+)
+
+
 def get_working_apify_client_part1():
     """Get working Apify client for Part 1 using credit management"""
     
@@ -434,11 +575,11 @@ def get_working_apify_client_part1():
         manager = ApifyAccountManager()
         return manager.get_client_part1()
     except Exception as e:
-        print(f"❌ Failed to get working Apify client for Part 1: {e}")
+        logger.error(f"❌ Failed to get working Apify client for Part 1: {e}")
         # Fallback to original method
         apify_token = os.getenv('APIFY_API_TOKEN') or os.getenv('APIFY_TOKEN')
         if apify_token:
-            print("🔥 Using fallback token for Part 1")
+            logger.warning("🔥 Using fallback token for Part 1")
             return ApifyClient(apify_token)
         raise e
 
@@ -450,10 +591,10 @@ def get_working_apify_client_part2():
         manager = ApifyAccountManager()
         return manager.get_client_part2()
     except Exception as e:
-        print(f"❌ Failed to get working Apify client for Part 2: {e}")
+        logger.error(f"❌ Failed to get working Apify client for Part 2: {e}")
         # Fallback to original method
         apify_token = os.getenv('APIFY_API_TOKEN') or os.getenv('APIFY_TOKEN')
         if apify_token:
-            print("🔥 Using fallback token for Part 2")
+            logger.warning("🔥 Using fallback token for Part 2")
             return ApifyClient(apify_token)
         raise e
\ No newline at end of file
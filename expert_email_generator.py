@@ -2,9 +2,67 @@ import os
 import re
 import json
 from typing import Dict, Any
-from openai import OpenAI
+from scraper_common import openai_client
 
 DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")  # fast + smart by default
+PROMPT_FIELD_CHARS = int(os.getenv("PROMPT_FIELD_CHARS", "500"))  # cap per scraped prompt field
+
+# Body clean-up patterns, compiled once instead of re-resolved on every email
+ARTIFACT_RE = re.compile(r'(INTENDED FOR|FIRE PROTECTION SCORE|REASON|--- EMAIL CONTENT ---).*?\n', re.I)
+SUBJECT_BLOCK_RE = re.compile(r'^Subject Line:.*?\n\n?', re.MULTILINE | re.IGNORECASE)
+SUBJECT_LINE_RE = re.compile(r'Subject Line:.*?\n', re.IGNORECASE)
+GREETING_RE = re.compile(r'(Hi [^,]+,)\s*')
+SENTENCE_BREAK_RE = re.compile(r'([.!?])\s+([A-Z])')
+CLOSING_RE = re.compile(r'([.!?])\s+(Best,|Regards,|Kind regards,)')
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+DASH_TO_COMMA = str.maketrans({'—': ',', '–': ','})
+
+
+# Cold-email prompt, built once; _build_prompt fills it with format_map
+EMAIL_PROMPT_TMPL = """
+You are a world-class B2B cold email expert trained on millions of high-converting campaigns. Write a
+first-touch email with a killer subject line using the inputs below.
+
+OBJECTIVE:
+A one-to-one, personalised first cold email. Confident, helpful, conversational. No spammy vibe.
+
+INPUTS:
+1) Target Name: {target_name}
+2) Target Job Title: {job_title}
+3) Company Name: {company_name}
+4) Company Website URL: {company_url}
+5) Scraped Website Summary: {website_summary}
+6) LinkedIn Bio / Notes: {linkedin_bio}
+7) Personal Hooks: {personal_hooks}
+8) Offer Summary: {your_offer_summary}
+
+OUTPUT FORMAT (use exactly):
+Subject Line: <3–7 words, curiosity/value-driven>
+
+Body:
+Hi {target_first_name},
+
+[custom hook proving this is not mass-mail — from company or personal info.]
+
+[one-sentence micro case study/outcome.]
+
+[one-sentence soft CTA inviting reply or a short call.]
+
+Regards,
+
+{your_name}
+{your_title}
+
+{your_email_signature}
+
+RULES:
+- No buzzwords (synergy/disrupt/etc). No hard sell.
+- Make it feel uniquely written for them.
+- Focus on BUILDING/PREMISES fire safety compliance (FRA, emergency lighting, alarms).
+- Do NOT pitch their services; focus on their own workplace compliance.
+- Proper paragraph spacing (blank line between thoughts).
+- Keep sentences tight and readable.
+"""
 
 
 class ExpertEmailGenerator:
@@ -25,7 +83,7 @@ class ExpertEmailGenerator:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY not set")
-        self.client = OpenAI(api_key=api_key)
+        self.client = openai_client(api_key)
 
     # ---------- PUBLIC ----------
 
@@ -78,15 +136,17 @@ class ExpertEmailGenerator:
         if contact.get("linkedin_profile_url"):
             linkedin_bio += f" - {contact['linkedin_profile_url']}"
 
+        # Scraped fields are clipped here, before any prompt string is built
+        cap = PROMPT_FIELD_CHARS
         return {
-            "target_name": name,
-            "target_first_name": first,
-            "job_title": title,
-            "company_name": company.get("company_name", "Your Company"),
-            "company_url": company.get("url", ""),
-            "website_summary": website_summary,
-            "linkedin_bio": linkedin_bio,
-            "personal_hooks": hooks,
+            "target_name": name[:cap],
+            "target_first_name": first[:cap],
+            "job_title": title[:cap],
+            "company_name": (company.get("company_name") or "Your Company")[:cap],
+            "company_url": (company.get("url") or "")[:cap],
+            "website_summary": website_summary[:cap],
+            "linkedin_bio": linkedin_bio[:cap],
+            "personal_hooks": hooks[:cap],
             "your_offer_summary": self.pfp_offer_summary,
         }
 
@@ -146,50 +206,12 @@ class ExpertEmailGenerator:
         return "; ".join(hooks[:3])
 
     def _build_prompt(self, d):
-        return f"""
-You are a world-class B2B cold email expert trained on millions of high-converting campaigns. Write a
-first-touch email with a killer subject line using the inputs below.
-
-OBJECTIVE:
-A one-to-one, personalised first cold email. Confident, helpful, conversational. No spammy vibe.
-
-INPUTS:
-1) Target Name: {d['target_name']}
-2) Target Job Title: {d['job_title']}
-3) Company Name: {d['company_name']}
-4) Company Website URL: {d['company_url']}
-5) Scraped Website Summary: {d['website_summary']}
-6) LinkedIn Bio / Notes: {d['linkedin_bio']}
-7) Personal Hooks: {d['personal_hooks']}
-8) Offer Summary: {d['your_offer_summary']}
-
-OUTPUT FORMAT (use exactly):
-Subject Line: <3–7 words, curiosity/value-driven>
-
-Body:
-Hi {d['target_first_name']},
-
-[custom hook proving this is not mass-mail — from company or personal info.]
-
-[one-sentence micro case study/outcome.]
-
-[one-sentence soft CTA inviting reply or a short call.]
-
-Regards,
-
-{self.your_name}
-{self.your_title}
-
-{self.your_email_signature}
-
-RULES:
-- No buzzwords (synergy/disrupt/etc). No hard sell.
-- Make it feel uniquely written for them.
-- Focus on BUILDING/PREMISES fire safety compliance (FRA, emergency lighting, alarms).
-- Do NOT pitch their services; focus on their own workplace compliance.
-- Proper paragraph spacing (blank line between thoughts).
-- Keep sentences tight and readable.
-"""
+        return EMAIL_PROMPT_TMPL.format_map({
+            **d,
+            "your_name": self.your_name,
+            "your_title": self.your_title,
+            "your_email_signature": self.your_email_signature,
+        })
 
     def _call_openai(self, prompt: str) -> str:
         resp = self.client.chat.completions.create(
@@ -231,8 +253,8 @@ RULES:
         body = self._format_body(body)
         
         # Remove any lingering "Subject Line:" text from the body
-        body = re.sub(r'^Subject Line:.*?\n\n?', '', body, flags=re.MULTILINE | re.IGNORECASE)
-        body = re.sub(r'Subject Line:.*?\n', '', body, flags=re.IGNORECASE)
+        body = SUBJECT_BLOCK_RE.sub('', body)
+        body = SUBJECT_LINE_RE.sub('', body)
 
         if not subject:
             subject = f"Quick fire safety check – {company.get('company_name', 'your business')}"
@@ -250,25 +272,24 @@ RULES:
         content = content.strip()
         
         # Clean any artifacts including subject line references
-        content = re.sub(r'(INTENDED FOR|FIRE PROTECTION SCORE|REASON|--- EMAIL CONTENT ---).*?\n', '', content, flags=re.I)
-        content = re.sub(r'^Subject Line:.*?\n\n?', '', content, flags=re.MULTILINE | re.IGNORECASE)
-        content = re.sub(r'Subject Line:.*?\n', '', content, flags=re.IGNORECASE)
+        content = ARTIFACT_RE.sub('', content)
+        content = SUBJECT_BLOCK_RE.sub('', content)
+        content = SUBJECT_LINE_RE.sub('', content)
         
-        # Replace em dashes with commas for better professional appearance
-        content = re.sub(r'—', ',', content)
-        content = re.sub(r'–', ',', content)  # Also handle en dashes
+        # Replace em/en dashes with commas for better professional appearance (one pass)
+        content = content.translate(DASH_TO_COMMA)
         
         # Spacing after greeting
-        content = re.sub(r'(Hi [^,]+,)\s*', r'\1\n\n', content)
+        content = GREETING_RE.sub(r'\1\n\n', content)
         
         # Ensure blank lines between sentences occasionally
-        content = re.sub(r'([.!?])\s+([A-Z])', r'\1\n\n\2', content)
+        content = SENTENCE_BREAK_RE.sub(r'\1\n\n\2', content)
         
         # Spacing before closing
-        content = re.sub(r'([.!?])\s+(Best,|Regards,|Kind regards,)', r'\1\n\n\2', content)
+        content = CLOSING_RE.sub(r'\1\n\n\2', content)
         
         # Tighten multiple newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = EXTRA_NEWLINES_RE.sub('\n\n', content)
         
         return content
 
@@ -2,6 +2,11 @@
 # 1. FIXED generate_patterns.py - Complete replacement
 # =============================================================================
 
+import re
+
+NON_ALPHA_RE = re.compile(r'[^a-z]')
+
+
 def generate_email_patterns(first_name, last_name, domain):
     """Generate 33+ common email patterns for a person"""
     # Clean and normalize names
@@ -9,9 +14,8 @@ def generate_email_patterns(first_name, last_name, domain):
     l = last_name.lower().strip()
     
     # Remove any non-alphabetic characters
-    import re
-    f = re.sub(r'[^a-z]', '', f)
-    l = re.sub(r'[^a-z]', '', l)
+    f = NON_ALPHA_RE.sub('', f)
+    l = NON_ALPHA_RE.sub('', l)
     
     if not f or not l:
         return []
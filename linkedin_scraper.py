@@ -4,9 +4,57 @@
 Handles LinkedIn employee scraping, email pattern discovery, and email verification
 """
 
+import functools
+import re
 import time
+from itertools import islice
 from urllib.parse import urlparse
-from account_manager import ApifyAccountManager, MillionVerifierManager
+from account_manager import ApifyAccountManager, MillionVerifierManager, apify_breaker
+from scraper_common import GPT_CACHE_TTL, get_logger, gpt_cache_fresh, gpt_cache_key, gpt_cache_load, gpt_cache_store, json_loads, openai_client
+
+# Child of the shared "smart_scraper" logger (same stream and SCRAPER_LOG_LEVEL)
+logger = get_logger("smart_scraper.linkedin")
+
+# Fallback company-account filter: one compiled scan instead of per-word any()
+_ACCOUNT_WORD_RE = re.compile(r'marketing|sales|support|team|dept|department')
+_GENERIC_ACCOUNT_NAMES = frozenset(['company', 'business', 'ltd', 'limited', 'inc', 'corp', 'team', 'department'])
+
+# Title keyword tiers (first match wins) - one alternation per tier
+_HIGH_PRIORITY_RE = re.compile(r'director|manager|head|chief|ceo|cto|cfo|vp|vice president|owner', re.IGNORECASE)
+_MEDIUM_PRIORITY_RE = re.compile(r'coordinator|specialist|lead|senior', re.IGNORECASE)
+_PATTERN_TEST_TIERS = (
+    (re.compile(r'ceo|owner|founder|director|managing', re.IGNORECASE), 90),        # senior leadership
+    (re.compile(r'manager|head|lead|supervisor', re.IGNORECASE), 80),              # management
+    (re.compile(r'specialist|coordinator|analyst|consultant', re.IGNORECASE), 60),  # core business roles
+    (re.compile(r'assistant|support|associate|officer|representative', re.IGNORECASE), 40),
+    (re.compile(r'freelance|contractor|brand ambassador', re.IGNORECASE), 20),
+    (re.compile(r'student|intern|graduate|university', re.IGNORECASE), 10),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _company_keys(company_name: str) -> tuple:
+    """Casefolded company name without TLD suffix, plus its space-free form (once per company)"""
+    folded = company_name.casefold().replace('.com', '').replace('.co.uk', '').replace('.ie', '')
+    return folded, folded.replace(' ', '')
+
+
+# Structured output for batched person classification - one verdict per line
+_VERDICT_SCHEMA = {
+    "name": "person_verdicts",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {"type": "string", "enum": ["PERSON", "COMPANY"]},
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
 
 
 class LinkedInScraper:
@@ -19,16 +67,29 @@ class LinkedInScraper:
         # Pattern learning storage
         self.discovered_email_pattern = None
         self.discovered_pattern_index = None
+        
+        # In-process copy of GPT cache entries: {sha256 key: (timestamp, text)}
+        self._chat_memo = {}
+        
+        # Apify account selection (credit check + test call per account) is
+        # done on first use and reused; a failed run clears it
+        self._apify = None
+    
+    def _apify_client(self):
+        """🔑 Lazily select the Part 2 Apify account; returns (manager, client)"""
+        if self._apify is None:
+            manager = ApifyAccountManager()
+            self._apify = (manager, manager.get_client_part2())
+        return self._apify
     
     def _determine_priority(self, title: str) -> str:
         """Determine employee priority based on title"""
         if not title:
             return 'standard'
             
-        title_lower = title.lower()
-        if any(keyword in title_lower for keyword in ['director', 'manager', 'head', 'chief', 'ceo', 'cto', 'cfo', 'vp', 'vice president', 'owner']):
+        if _HIGH_PRIORITY_RE.search(title):
             return 'high'
-        elif any(keyword in title_lower for keyword in ['coordinator', 'specialist', 'lead', 'senior']):
+        elif _MEDIUM_PRIORITY_RE.search(title):
             return 'medium'
         else:
             return 'standard'
@@ -38,51 +99,49 @@ class LinkedInScraper:
         
         try:
             # Step 1: Native Actor 2 scraping with smart email discovery
-            print("\n🔍 STEP 1: NATIVE ACTOR 2 SCRAPING WITH SMART EMAIL DISCOVERY")
+            logger.info("\n🔍 STEP 1: NATIVE ACTOR 2 SCRAPING WITH SMART EMAIL DISCOVERY")
             linkedin_contacts = self._native_scrape_linkedin_actor2(linkedin_url, domain)
             
             if not linkedin_contacts:
-                print("❌ No employees found with Native Actor 2")
+                logger.warning("❌ No employees found with Native Actor 2")
                 return []
             
             # Cooling-off period after pattern discovery
-            print("\n⏳ COOLING-OFF PERIOD: Waiting 2 seconds after pattern discovery...")
+            logger.info("\n⏳ COOLING-OFF PERIOD: Waiting 2 seconds after pattern discovery...")
             time.sleep(2)
             
             # Step 1.5: Apply learned pattern to ALL employees
             if self.discovered_email_pattern:
-                print(f"\n🚀 STEP 1.5: APPLYING LEARNED PATTERN TO ALL EMPLOYEES")
+                logger.info(f"\n🚀 STEP 1.5: APPLYING LEARNED PATTERN TO ALL EMPLOYEES")
                 linkedin_contacts = self._apply_pattern_to_all_employees(linkedin_contacts, domain)
             
             # Step 2: Fire protection targeting
-            print("\n🎯 STEP 2: FIRE PROTECTION TARGETING")
+            logger.info("\n🎯 STEP 2: FIRE PROTECTION TARGETING")
             fire_targets = self._score_fire_protection_targets(linkedin_contacts)
             
             # Step 3: Final email discovery for any remaining targets without emails
-            print("\n📧 STEP 3: FINAL EMAIL DISCOVERY WITH GOLDEN PATTERNS")
+            logger.info("\n📧 STEP 3: FINAL EMAIL DISCOVERY WITH GOLDEN PATTERNS")
             verified_contacts = self._discover_emails_golden_patterns(fire_targets, domain)
             
             return verified_contacts
             
         except Exception as e:
-            print(f"❌ LinkedIn pipeline failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"❌ LinkedIn pipeline failed: {e}")
             return []
 
     def _native_scrape_linkedin_actor2(self, linkedin_url: str, domain: str) -> list:
         """🔍 Native Actor 2 scraping with smart priority-based pattern discovery"""
         
-        print("🎯 NATIVE LINKEDIN ACTOR 2 SCRAPER")
-        print("🔍 Target: Company employees with built-in email finding + Golden patterns fallback")
-        print(f"🔗 LinkedIn URL: {linkedin_url}")
-        print("=" * 70)
+        logger.info("🎯 NATIVE LINKEDIN ACTOR 2 SCRAPER")
+        logger.info("🔍 Target: Company employees with built-in email finding + Golden patterns fallback")
+        logger.info(f"🔗 LinkedIn URL: {linkedin_url}")
+        logger.info("=" * 70)
+        
+        if not apify_breaker.allow():
+            logger.warning("⚡ Apify circuit open (recent failures) - skipping Native Actor 2")
+            return []
         
         try:
-            # Get Apify client with account management
-            manager = ApifyAccountManager()
-            client = manager.get_client_part2()  # Changed from part1 to part2 since this is LinkedIn scraping
-            
             # Native Actor 2 configuration for email finding
             actor_input = {
                 "companies": [linkedin_url],
@@ -92,39 +151,68 @@ class LinkedInScraper:
                 "timeout": 120
             }
             
-            print("🚀 Running Native Actor 2 with email configuration...")
-            print(f"📧 Configuration: mode=full_email, includeEmails=True")
-            print(f"💰 Estimated cost: ~${actor_input['maxItems'] * 12 / 1000:.2f}")
+            logger.info("🚀 Running Native Actor 2 with email configuration...")
+            logger.info(f"📧 Configuration: mode=full_email, includeEmails=True")
+            logger.info(f"💰 Estimated cost: ~${actor_input['maxItems'] * 12 / 1000:.2f}")
             
-            # Run Actor 2
-            run = client.actor("harvestapi/linkedin-company-employees").call(run_input=actor_input)
+            # Run Actor 2 - start it and wait with a bounded timeout rather than
+            # blocking on .call(); a run that overruns is aborted to stop billing
+            # and whatever it already pushed to the dataset is used. Any error
+            # from here until the run status is known counts against the breaker
+            # (allow() may have handed this call the single half-open trial)
+            try:
+                # Get Apify client with account management (part2 - LinkedIn scraping)
+                manager, client = self._apify_client()
+                started = client.actor("harvestapi/linkedin-company-employees").start(run_input=actor_input)
+                run_client = client.run(started["id"])
+                run = run_client.wait_for_finish(wait_secs=actor_input['timeout'] + 60)
+            except Exception:
+                apify_breaker.record_failure()
+                self._apify = None  # re-select the account on the next run
+                raise
+            
+            if run and run.get("status") in ("SUCCEEDED", "READY", "RUNNING"):
+                apify_breaker.record_success()
+            else:
+                apify_breaker.record_failure()
+                self._apify = None
+            
+            if run and run.get("status") in ("READY", "RUNNING"):
+                logger.info("⏱️ Native Actor 2 still running after timeout - aborting and using partial results")
+                run = run_client.abort() or run
             
             # Record usage
             if hasattr(client, '_account_info'):
                 manager.record_usage(client._account_info, success=(run is not None))
             
             if not run:
-                print("❌ Native Actor 2 run failed")
+                logger.error("❌ Native Actor 2 run failed")
                 return []
             
-            # Process results
-            items = client.dataset(run["defaultDatasetId"]).list_items().items
-            print(f"📊 Processing {len(items)} results from Native Actor 2...")
+            # Process results - stream pages from the dataset instead of
+            # downloading it whole, and stop once maxItems profiles are seen
+            items = list(islice(client.dataset(run["defaultDatasetId"]).iterate_items(), actor_input['maxItems']))
+            logger.info(f"📊 Processing {len(items)} results from Native Actor 2...")
+            
+            # Extract employee names/titles and validate them all in one GPT call
+            profiles = [
+                (f"{item.get('firstName', '')} {item.get('lastName', '')}".strip(),
+                 item.get('headline', '') or item.get('position', '') or 'Employee')
+                for item in items
+            ]
+            verdicts = self._are_real_people_gpt(profiles, domain)
             
             processed_employees = []
             
-            for item in items:
+            for item, (name, title), is_person in zip(items, profiles, verdicts):
                 try:
-                    # Extract employee data
-                    name = f"{item.get('firstName', '')} {item.get('lastName', '')}".strip()
-                    title = item.get('headline', '') or item.get('position', '') or 'Employee'
                     email = (item.get('email', '') or 
                            item.get('emailAddress', '') or 
                            item.get('contactEmail', ''))
                     
-                    # Person validation using GPT-4o-mini
-                    if not self._is_real_person_gpt(name, title, domain):
-                        print(f"   ⚠️ Skipping non-person account: {name}")
+                    # Person validation using GPT-4o-mini (batched above)
+                    if not is_person:
+                        logger.warning(f"   ⚠️ Skipping non-person account: {name}")
                         continue
                     
                     employee = {
@@ -141,7 +229,7 @@ class LinkedInScraper:
                     processed_employees.append(employee)
                     
                     if email:
-                        print(f"   📧 EMAIL FOUND: {name} - {email}")
+                        logger.info(f"   📧 EMAIL FOUND: {name} - {email}")
                         
                         # Learn pattern from Actor 2 email immediately
                         if not self.discovered_email_pattern:
@@ -153,47 +241,47 @@ class LinkedInScraper:
                                 if pattern:
                                     self.discovered_email_pattern = pattern
                                     self.discovered_pattern_index = "actor2"
-                                    print(f"   🧠 LEARNED PATTERN from Actor 2: {pattern}")
+                                    logger.info(f"   🧠 LEARNED PATTERN from Actor 2: {pattern}")
                     else:
-                        print(f"   📋 Processing: {name} | {title} | ❌")
-                        print(f"   ⚠️ EMPLOYEE NO EMAIL: {name} - will try golden patterns")
+                        logger.info(f"   📋 Processing: {name} | {title} | ❌")
+                        logger.warning(f"   ⚠️ EMPLOYEE NO EMAIL: {name} - will try golden patterns")
                     
                 except Exception as e:
-                    print(f"   ❌ Error processing profile: {e}")
+                    logger.error(f"   ❌ Error processing profile: {e}")
                     continue
             
             # Count emails from Actor 2
             with_emails_actor2 = [e for e in processed_employees if e.get('email')]
-            print(f"\n🎯 NATIVE ACTOR 2 RESULTS:")
-            print(f"📊 Total employee profiles found: {len(processed_employees)}")
-            print(f"📧 Profiles with emails from Actor 2: {len(with_emails_actor2)}")
-            print(f"📊 Actor 2 email success rate: {(len(with_emails_actor2)/len(processed_employees)*100):.1f}%" if processed_employees else "0.0%")
+            logger.info(f"\n🎯 NATIVE ACTOR 2 RESULTS:")
+            logger.info(f"📊 Total employee profiles found: {len(processed_employees)}")
+            logger.info(f"📧 Profiles with emails from Actor 2: {len(with_emails_actor2)}")
+            logger.info(f"📊 Actor 2 email success rate: {(len(with_emails_actor2)/len(processed_employees)*100):.1f}%" if processed_employees else "0.0%")
             
             # If Actor 2 found no emails, test golden patterns with smart prioritization
             if len(with_emails_actor2) == 0 and processed_employees:
-                print("\n🔥 TESTING ALL 33 GOLDEN EMAIL PATTERNS:")
+                logger.info("\n🔥 TESTING ALL 33 GOLDEN EMAIL PATTERNS:")
                 
                 employees_without_emails = [e for e in processed_employees if not e.get('email')]
                 
                 if employees_without_emails:
-                    print("🧠 PRIORITIZING CONTACTS FOR PATTERN TESTING")
+                    logger.info("🧠 PRIORITIZING CONTACTS FOR PATTERN TESTING")
                     
                     # Add priority scores to employees
                     for employee in employees_without_emails:
                         title = employee.get('title', '').lower()
                         priority_score = self._calculate_pattern_test_priority(title)
                         employee['pattern_test_priority'] = priority_score
-                        print(f"   📊 {employee.get('name', 'Unknown')} - {employee.get('title', 'Unknown')} | Priority: {priority_score}")
+                        logger.info(f"   📊 {employee.get('name', 'Unknown')} - {employee.get('title', 'Unknown')} | Priority: {priority_score}")
                     
                     # Sort by priority (highest first)
                     employees_without_emails.sort(key=lambda x: x.get('pattern_test_priority', 0), reverse=True)
                     
-                    print(f"\n🎯 TOP 5 PRIORITY CONTACTS FOR PATTERN TESTING:")
+                    logger.info(f"\n🎯 TOP 5 PRIORITY CONTACTS FOR PATTERN TESTING:")
                     for i, employee in enumerate(employees_without_emails[:5], 1):
                         name = employee.get('name', 'Unknown')
                         title = employee.get('title', 'Unknown Role')
                         score = employee.get('pattern_test_priority', 0)
-                        print(f"   {i}. {name} - {title} (Score: {score})")
+                        logger.info(f"   {i}. {name} - {title} (Score: {score})")
                     
                     # Test golden patterns on high-priority employees (up to 5)
                     pattern_found = False
@@ -208,20 +296,20 @@ class LinkedInScraper:
                             middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
                             priority_score = test_employee.get('pattern_test_priority', 0)
                             
-                            print(f"\n🧪 Testing ALL golden patterns for: {first_name} {middle_name} {last_name} @ {domain}".replace("  ", " "))
-                            print(f"   📋 Title: {test_employee.get('title', 'Unknown')} (Priority Score: {priority_score})")
-                            print(f"   🔢 Testing candidate {test_num}/{min(len(employees_without_emails), max_tests)}")
+                            logger.info(f"\n🧪 Testing ALL golden patterns for: {first_name} {middle_name} {last_name} @ {domain}".replace("  ", " "))
+                            logger.info(f"   📋 Title: {test_employee.get('title', 'Unknown')} (Priority Score: {priority_score})")
+                            logger.info(f"   🔢 Testing candidate {test_num}/{min(len(employees_without_emails), max_tests)}")
                             
                             # Generate all 33 golden patterns
                             golden_emails = self._generate_all_golden_patterns(first_name, last_name, domain, middle_name)
                             
-                            print(f"📧 Testing {len(golden_emails)} golden email combinations:")
+                            logger.info(f"📧 Testing {len(golden_emails)} golden email combinations:")
                             
                             for i, email in enumerate(golden_emails, 1):
-                                print(f"   🔍 Testing golden pattern {i}/{len(golden_emails)}: {email}")
+                                logger.info(f"   🔍 Testing golden pattern {i}/{len(golden_emails)}: {email}")
                                 if self.millionverifier.smart_verify_email(email, domain):
-                                    print(f"   ✅ GOLDEN PATTERN FOUND: {email}")
-                                    print(f"   🎯 SUCCESS: Pattern {i} worked!")
+                                    logger.info(f"   ✅ GOLDEN PATTERN FOUND: {email}")
+                                    logger.info(f"   🎯 SUCCESS: Pattern {i} worked!")
                                     
                                     # Update the employee with found email
                                     test_employee['email'] = email
@@ -232,83 +320,135 @@ class LinkedInScraper:
                                     if pattern:
                                         self.discovered_email_pattern = pattern
                                         self.discovered_pattern_index = i
-                                        print(f"   🧠 LEARNED PATTERN for later use: {pattern}")
+                                        logger.info(f"   🧠 LEARNED PATTERN for later use: {pattern}")
                                     
                                     pattern_found = True
                                     break
                                 else:
-                                    print(f"   ❌ Golden pattern invalid: {email}")
+                                    logger.warning(f"   ❌ Golden pattern invalid: {email}")
                             
                             if pattern_found:
-                                print(f"\n🎉 SUCCESS: Found email using golden pattern #{i} out of {len(golden_emails)} total patterns")
+                                logger.info(f"\n🎉 SUCCESS: Found email using golden pattern #{i} out of {len(golden_emails)} total patterns")
                                 break
                             else:
-                                print(f"   😞 No valid emails found for {test_employee['name']} after testing {len(golden_emails)} patterns")
+                                logger.warning(f"   😞 No valid emails found for {test_employee['name']} after testing {len(golden_emails)} patterns")
                     
                     if not pattern_found:
-                        print(f"\n😞 No valid emails found after testing {min(len(employees_without_emails), max_tests)} high-priority candidates")
+                        logger.warning(f"\n😞 No valid emails found after testing {min(len(employees_without_emails), max_tests)} high-priority candidates")
             
             # Log discovered pattern for next phase
             if self.discovered_email_pattern:
-                print(f"\n🧠 PATTERN DISCOVERED: {self.discovered_email_pattern} (will be applied to all employees)")
+                logger.info(f"\n🧠 PATTERN DISCOVERED: {self.discovered_email_pattern} (will be applied to all employees)")
             else:
-                print(f"\n⚠️ NO PATTERN DISCOVERED: Will test all patterns for each target")
+                logger.warning(f"\n⚠️ NO PATTERN DISCOVERED: Will test all patterns for each target")
             
             return processed_employees
             
         except Exception as e:
-            print(f"❌ Native Actor 2 scraper failed: {e}")
+            logger.error(f"❌ Native Actor 2 scraper failed: {e}")
             return []
 
-    def _is_real_person_gpt(self, name: str, title: str, company_name: str) -> bool:
-        """🧠 Use GPT-4o-mini to determine if this is a real person or company account"""
+    def _cached_chat(self, model: str, prompt: str, max_tokens: int, temperature: float, response_format=None) -> str:
+        """💾 Chat completion memoized on disk - stale copy is served if OpenAI fails"""
+        
+        key = gpt_cache_key(model, prompt)
+        
+        # Repeat prompt in this process - skip the cache file read entirely
+        memo = self._chat_memo.get(key)
+        if memo and time.time() - memo[0] <= GPT_CACHE_TTL:
+            return memo[1]
+        
+        cached = gpt_cache_load(model, prompt)
+        if gpt_cache_fresh(cached):
+            logger.info(f"   💾 GPT cache hit ({model})")
+            self._chat_memo[key] = (cached['ts'], cached['text'])
+            return cached['text']
+        
+        try:
+            request = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": max_tokens,
+                "temperature": temperature
+            }
+            if response_format:
+                request["response_format"] = response_format
+            
+            response = openai_client(self.openai_key).chat.completions.create(**request)
+            text = response.choices[0].message.content
+        except Exception as e:
+            if cached:
+                logger.warning(f"   ⚠️ OpenAI call failed ({e}) - using last cached response")
+                return cached['text']
+            raise
+        
+        gpt_cache_store(model, prompt, text)
+        self._chat_memo[key] = (time.time(), text)
+        return text
+    
+    def _are_real_people_gpt(self, profiles: list, company_name: str) -> list:
+        """🧠 Use one GPT-4o-mini call to classify (name, title) pairs as real people or company accounts"""
+        
+        if not profiles:
+            return []
+        
+        # Repeated (name, title) pairs are classified once and fanned back out
+        unique = list(dict.fromkeys(profiles))
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.openai_key)
+            profile_lines = "\n".join(
+                f'{i}. Name: "{name}" | Title: "{title}"' for i, (name, title) in enumerate(unique, 1)
+            )
             
-            prompt = f"""Analyze if this is a REAL PERSON or a COMPANY ACCOUNT:
+            prompt = f"""For each numbered account below, decide if it is a REAL PERSON or a COMPANY ACCOUNT.
 
-Name: "{name}"
-Title: "{title}"
 Company: "{company_name}"
 
+{profile_lines}
+
 Guidelines:
 - REAL PERSON: Has first name + last name (e.g., "John Smith", "Maria Garcia", "李明", "Kathleen McDonagh")
 - COMPANY ACCOUNT: Business names, departments, generic titles (e.g., "Go West", "Marketing Team", "Sales Dept", "Company Ltd")
 - Consider cultural naming conventions globally
 
-Answer with exactly one word: PERSON or COMPANY"""
+Return JSON: {{"results": ["PERSON" or "COMPANY", ...]}} with exactly {len(unique)} entries, in the same order."""
 
-            response = client.chat.completions.create(
+            result_text = self._cached_chat(
                 model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                temperature=0.1
+                prompt=prompt,
+                max_tokens=10 * len(unique) + 20,
+                temperature=0.1,
+                response_format={"type": "json_schema", "json_schema": _VERDICT_SCHEMA}
             )
             
-            result = response.choices[0].message.content.strip().upper()
-            is_person = "PERSON" in result
+            results = json_loads(result_text).get("results", [])
+            if len(results) != len(unique):
+                raise ValueError(f"expected {len(unique)} verdicts, got {len(results)}")
             
-            print(f"   🧠 GPT-4o-mini: '{name}' = {'REAL PERSON' if is_person else 'COMPANY ACCOUNT'}")
-            return is_person
+            verdicts = {}
+            for profile, result in zip(unique, results):
+                is_person = "PERSON" in str(result).upper()
+                logger.debug(f"   🧠 GPT-4o-mini: '{profile[0]}' = {'REAL PERSON' if is_person else 'COMPANY ACCOUNT'}")
+                verdicts[profile] = is_person
+            return [verdicts[profile] for profile in profiles]
             
         except Exception as e:
-            print(f"   ⚠️ GPT validation failed: {e}, using fallback filter")
-            return self._is_real_person_basic(name, title, company_name)
+            logger.warning(f"   ⚠️ GPT validation failed: {e}, using fallback filter")
+            return [self._is_real_person_basic(name, title, company_name) for name, title in profiles]
     
     def _is_real_person_basic(self, name: str, title: str, company_name: str) -> bool:
         """🔍 Basic code-based filtering as fallback"""
         
-        name_lower = name.lower()
-        company_lower = company_name.lower().replace('.com', '').replace('.co.uk', '').replace('.ie', '')
+        # Casefold once and compare against the folded copies throughout
+        name_lower = name.casefold()
+        company_lower, company_nospace = _company_keys(company_name)
         
         # Skip obvious company accounts
         if (name_lower == company_lower or 
-            name_lower.replace(' ', '') == company_lower.replace(' ', '') or
-            name_lower in ['company', 'business', 'ltd', 'limited', 'inc', 'corp', 'team', 'department'] or
+            name_lower.replace(' ', '') == company_nospace or
+            name_lower in _GENERIC_ACCOUNT_NAMES or
             len(name.split()) == 1 or  # Single word names
-            any(word in name_lower for word in ['marketing', 'sales', 'support', 'team', 'dept', 'department'])):
+            _ACCOUNT_WORD_RE.search(name_lower)):
             return False
         
         return True
@@ -318,31 +458,10 @@ Answer with exactly one word: PERSON or COMPANY"""
         if not title:
             return 0
             
-        title_lower = title.lower()
-        
-        # Highest priority - Senior leadership (most likely to have company emails)
-        if any(keyword in title_lower for keyword in ['ceo', 'owner', 'founder', 'director', 'managing']):
-            return 90
-            
-        # High priority - Management roles
-        if any(keyword in title_lower for keyword in ['manager', 'head', 'lead', 'supervisor', 'account manager']):
-            return 80
-            
-        # Medium-high priority - Core business roles
-        if any(keyword in title_lower for keyword in ['specialist', 'coordinator', 'analyst', 'consultant']):
-            return 60
-            
-        # Medium priority - Support roles
-        if any(keyword in title_lower for keyword in ['assistant', 'support', 'associate', 'officer', 'representative']):
-            return 40
-            
-        # Lower priority - Contract/freelance roles
-        if any(keyword in title_lower for keyword in ['freelance', 'contractor', 'brand ambassador']):
-            return 20
-            
-        # Lowest priority - Students/temporary roles
-        if any(keyword in title_lower for keyword in ['student', 'intern', 'graduate', 'university']):
-            return 10
+        # Senior leadership first (most likely to have company emails), students last
+        for tier, score in _PATTERN_TEST_TIERS:
+            if tier.search(title):
+                return score
             
         # Default for unclear roles
         return 30
@@ -350,17 +469,17 @@ Answer with exactly one word: PERSON or COMPANY"""
     def _apply_pattern_to_all_employees(self, linkedin_contacts: list, domain: str) -> list:
         """🧠 Apply learned pattern to ALL employees with guaranteed email saving"""
         
-        print("🧠 APPLYING LEARNED PATTERN TO ALL EMPLOYEES")
+        logger.info("🧠 APPLYING LEARNED PATTERN TO ALL EMPLOYEES")
         
         # Get the discovered pattern
         pattern = getattr(self, 'discovered_email_pattern', None)
         if not pattern:
-            print("⚠️ No pattern discovered - cannot apply to employees")
+            logger.warning("⚠️ No pattern discovered - cannot apply to employees")
             return linkedin_contacts
             
-        print(f"🎯 Pattern: {pattern}")
-        print(f"📊 Testing pattern on {len(linkedin_contacts)} employees")
-        print("=" * 70)
+        logger.info(f"🎯 Pattern: {pattern}")
+        logger.info(f"📊 Testing pattern on {len(linkedin_contacts)} employees")
+        logger.info("=" * 70)
         
         # Track statistics
         emails_found = 0
@@ -390,7 +509,7 @@ Answer with exactly one word: PERSON or COMPANY"""
             if not test_email:
                 continue
                 
-            print(f"🧪 Testing learned pattern for {name}: {test_email}")
+            logger.info(f"🧪 Testing learned pattern for {name}: {test_email}")
             
             # Verify email with MillionVerifier
             try:
@@ -404,41 +523,41 @@ Answer with exactly one word: PERSON or COMPANY"""
                     contact['pattern_used'] = pattern
                     contact['verification_status'] = 'verified'
                     
-                    print(f"✅ PATTERN SUCCESS: {name} - {test_email}")
+                    logger.info(f"✅ PATTERN SUCCESS: {name} - {test_email}")
                     emails_found += 1
                 else:
-                    print(f"❌ Pattern failed for {name}: {test_email}")
+                    logger.warning(f"❌ Pattern failed for {name}: {test_email}")
                     emails_failed += 1
                     
             except Exception as e:
-                print(f"❌ Error verifying {test_email}: {e}")
+                logger.error(f"❌ Error verifying {test_email}: {e}")
                 emails_failed += 1
         
         # Verification step
         contacts_with_emails = [c for c in linkedin_contacts if c.get('email')]
         
-        print(f"\n🎉 PATTERN APPLICATION RESULTS:")
-        print(f"   🧠 Pattern applied: {pattern}")
-        print(f"   ✅ New emails found: {emails_found}")
-        print(f"   ❌ Pattern failures: {emails_failed}")
-        print(f"   📊 Total contacts with emails: {len(contacts_with_emails)}")
+        logger.info(f"\n🎉 PATTERN APPLICATION RESULTS:")
+        logger.info(f"   🧠 Pattern applied: {pattern}")
+        logger.info(f"   ✅ New emails found: {emails_found}")
+        logger.warning(f"   ❌ Pattern failures: {emails_failed}")
+        logger.info(f"   📊 Total contacts with emails: {len(contacts_with_emails)}")
         
         return linkedin_contacts
 
     def _score_fire_protection_targets(self, linkedin_contacts: list, max_targets: int = 2) -> list:
         """🎯 Fire protection targeting from verified emails"""
         
-        print("🔥 FIRE PROTECTION CONTACT IDENTIFICATION")
-        print(f"🎯 Target: {max_targets} most relevant fire protection decision-makers")
-        print("=" * 70)
+        logger.info("🔥 FIRE PROTECTION CONTACT IDENTIFICATION")
+        logger.info(f"🎯 Target: {max_targets} most relevant fire protection decision-makers")
+        logger.info("=" * 70)
         
         # Only consider contacts that have verified emails
         contacts_with_emails = [c for c in linkedin_contacts if c.get('email')]
         
-        print(f"📧 Analyzing {len(contacts_with_emails)} contacts with verified emails")
+        logger.info(f"📧 Analyzing {len(contacts_with_emails)} contacts with verified emails")
         
         if not contacts_with_emails:
-            print("❌ No contacts with verified emails found")
+            logger.warning("❌ No contacts with verified emails found")
             return []
         
         # Fire protection scoring criteria
@@ -494,25 +613,25 @@ Answer with exactly one word: PERSON or COMPANY"""
             
             scored_contacts.append(contact)
             
-            print(f"   📊 {contact['name']} - {contact['title']} | Score: {best_score} | {contact['email']} | {best_reason}")
+            logger.info(f"   📊 {contact['name']} - {contact['title']} | Score: {best_score} | {contact['email']} | {best_reason}")
         
         # Sort by score and select top targets
         scored_contacts.sort(key=lambda x: x['fire_protection_score'], reverse=True)
         fire_targets = scored_contacts[:max_targets]
         
-        print(f"\n🎯 TOP {max_targets} FIRE PROTECTION TARGETS SELECTED:")
+        logger.info(f"\n🎯 TOP {max_targets} FIRE PROTECTION TARGETS SELECTED:")
         for i, target in enumerate(fire_targets, 1):
-            print(f"   {i}. {target['name']} - {target['title']}")
-            print(f"      Score: {target['fire_protection_score']} | Email: {target['email']} | {target['fire_protection_reason']}")
+            logger.info(f"   {i}. {target['name']} - {target['title']}")
+            logger.info(f"      Score: {target['fire_protection_score']} | Email: {target['email']} | {target['fire_protection_reason']}")
         
         return fire_targets
 
     def _discover_emails_golden_patterns(self, fire_targets: list, domain: str) -> list:
         """📧 Final email discovery using golden patterns fallback"""
         
-        print("🧠 FINAL EMAIL DISCOVERY (GOLDEN PATTERNS FALLBACK)")
-        print(f"🎯 Target: {len(fire_targets)} fire protection contacts")
-        print("=" * 70)
+        logger.info("🧠 FINAL EMAIL DISCOVERY (GOLDEN PATTERNS FALLBACK)")
+        logger.info(f"🎯 Target: {len(fire_targets)} fire protection contacts")
+        logger.info("=" * 70)
         
         verified_contacts = []
         contacts_needing_emails = []
@@ -520,43 +639,43 @@ Answer with exactly one word: PERSON or COMPANY"""
         # Separate contacts that already have emails vs those that need emails
         for contact in fire_targets:
             if contact.get('email') and contact.get('verification_status') == 'verified':
-                print(f"✅ {contact['name']} already has verified email: {contact['email']}")
+                logger.info(f"✅ {contact['name']} already has verified email: {contact['email']}")
                 verified_contacts.append(contact)
             else:
                 contacts_needing_emails.append(contact)
-                print(f"❌ {contact['name']} needs email discovery")
+                logger.warning(f"❌ {contact['name']} needs email discovery")
         
         if not contacts_needing_emails:
-            print("\n🎉 All fire protection targets already have verified emails!")
+            logger.info("\n🎉 All fire protection targets already have verified emails!")
             return verified_contacts
         
-        print(f"\n🔧 GOLDEN PATTERN FALLBACK for {len(contacts_needing_emails)} contacts:")
+        logger.info(f"\n🔧 GOLDEN PATTERN FALLBACK for {len(contacts_needing_emails)} contacts:")
         
         # Apply golden patterns to remaining contacts
         for contact in contacts_needing_emails:
             name_parts = contact['name'].split()
             if len(name_parts) < 2:
-                print(f"   ⚠️ Cannot parse name '{contact['name']}' for pattern generation")
+                logger.warning(f"   ⚠️ Cannot parse name '{contact['name']}' for pattern generation")
                 continue
             
             first_name = name_parts[0]
             last_name = name_parts[-1]
             middle_name = " ".join(name_parts[1:-1]) if len(name_parts) > 2 else ""
             
-            print(f"\n📧 DISCOVERING EMAIL FOR: {contact['name']}")
+            logger.info(f"\n📧 DISCOVERING EMAIL FOR: {contact['name']}")
             
             # Generate and test all 33 golden patterns
             golden_emails = self._generate_all_golden_patterns(first_name, last_name, domain, middle_name)
             
-            print(f"🧪 Testing {len(golden_emails)} golden email patterns:")
+            logger.info(f"🧪 Testing {len(golden_emails)} golden email patterns:")
             
             email_found = False
             for i, email in enumerate(golden_emails, 1):
-                print(f"   🔍 Testing pattern {i}/{len(golden_emails)}: {email}")
+                logger.info(f"   🔍 Testing pattern {i}/{len(golden_emails)}: {email}")
                 
                 if self.millionverifier.smart_verify_email(email, domain):
-                    print(f"   ✅ GOLDEN PATTERN SUCCESS: {email}")
-                    print(f"   🎯 MATCH: Pattern {i} worked for {contact['name']}!")
+                    logger.info(f"   ✅ GOLDEN PATTERN SUCCESS: {email}")
+                    logger.info(f"   🎯 MATCH: Pattern {i} worked for {contact['name']}!")
                     
                     contact['email'] = email
                     contact['email_source'] = f'golden_pattern_{i}'
@@ -565,15 +684,15 @@ Answer with exactly one word: PERSON or COMPANY"""
                     email_found = True
                     break
                 else:
-                    print(f"   ❌ Pattern invalid: {email}")
+                    logger.warning(f"   ❌ Pattern invalid: {email}")
             
             if not email_found:
-                print(f"   😞 No valid email found for {contact['name']} after testing {len(golden_emails)} patterns")
+                logger.warning(f"   😞 No valid email found for {contact['name']} after testing {len(golden_emails)} patterns")
         
-        print(f"\n📧 FINAL EMAIL DISCOVERY SUMMARY:")
-        print(f"   🎯 Fire protection targets processed: {len(fire_targets)}")
-        print(f"   ✅ Total verified email addresses: {len(verified_contacts)}")
-        print(f"   📊 Overall success rate: {(len(verified_contacts)/len(fire_targets)*100):.1f}%" if fire_targets else "0.0%")
+        logger.info(f"\n📧 FINAL EMAIL DISCOVERY SUMMARY:")
+        logger.info(f"   🎯 Fire protection targets processed: {len(fire_targets)}")
+        logger.info(f"   ✅ Total verified email addresses: {len(verified_contacts)}")
+        logger.info(f"   📊 Overall success rate: {(len(verified_contacts)/len(fire_targets)*100):.1f}%" if fire_targets else "0.0%")
         
         return verified_contacts
 
@@ -613,14 +732,14 @@ Answer with exactly one word: PERSON or COMPANY"""
             # Find exact match
             for local_pattern, template in pattern_map.items():
                 if local_part == local_pattern:
-                    print(f"   🧠 Pattern extracted: {local_part} → {template}")
+                    logger.info(f"   🧠 Pattern extracted: {local_part} → {template}")
                     return template
             
-            print(f"   ⚠️ Could not extract clear pattern from {email}")
+            logger.warning(f"   ⚠️ Could not extract clear pattern from {email}")
             return None
             
         except Exception as e:
-            print(f"   ⚠️ Could not extract pattern from {email}: {e}")
+            logger.warning(f"   ⚠️ Could not extract pattern from {email}: {e}")
             return None
 
     def _apply_pattern_to_name(self, pattern: str, first_name: str, last_name: str, domain: str, middle_name: str = "") -> str:
@@ -645,14 +764,14 @@ Answer with exactly one word: PERSON or COMPANY"""
             
             # Check if pattern was successfully applied
             if '{' in email_local or '}' in email_local:
-                print(f"   ⚠️ Pattern {pattern} could not be fully applied to {first} {last}")
+                logger.warning(f"   ⚠️ Pattern {pattern} could not be fully applied to {first} {last}")
                 return None
             
             full_email = f"{email_local}@{domain}"
             return full_email
             
         except Exception as e:
-            print(f"   ⚠️ Could not apply pattern {pattern}: {e}")
+            logger.warning(f"   ⚠️ Could not apply pattern {pattern}: {e}")
             return None
 
     def _generate_all_golden_patterns(self, first_name: str, last_name: str, domain: str, middle_name: str = "") -> list:
@@ -24,10 +24,13 @@ Features:
 
 from __future__ import annotations
 import os
+import re
 import sys
 import csv
 import time
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 from dotenv import load_dotenv
@@ -43,6 +46,7 @@ try:
     from expert_email_generator import ExpertEmailGenerator
     from send_smtp import send_email
     from generate_patterns import generate_email_patterns
+    from scraper_common import name_key
     print("✅ All modules imported successfully")
 except ImportError as e:
     print(f"❌ Missing modules: {e}")
@@ -50,6 +54,32 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Title keyword tiers, first match wins. One case-insensitive alternation per
+# tier instead of a Python-level any() over each keyword.
+_FALLBACK_PRIORITY_TIERS = (
+    (re.compile(r'owner|founder|director|ceo', re.IGNORECASE), 90),
+    (re.compile(r'manager|head|chief|lead', re.IGNORECASE), 75),
+    (re.compile(r'specialist|coordinator|analyst', re.IGNORECASE), 50),
+    (re.compile(r'assistant|support|associate', re.IGNORECASE), 25),
+)
+_FIRE_RELEVANCE_TIERS = (
+    (re.compile(r'owner|director|managing', re.IGNORECASE), 75),
+    (re.compile(r'manager|head|chief', re.IGNORECASE), 65),
+    (re.compile(r'coordinator|specialist', re.IGNORECASE), 45),
+)
+_FIRE_REASON_TIERS = (
+    (re.compile(r'owner|founder', re.IGNORECASE), "Business owner - ultimate responsibility for fire safety compliance"),
+    (re.compile(r'director|managing', re.IGNORECASE), "Senior management - budget authority for fire protection systems"),
+    (re.compile(r'manager|head', re.IGNORECASE), "Management role - responsible for workplace safety procedures"),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _bare_domain(url: str) -> str:
+    """🌐 Host without the www. prefix (memoized - the same URL is parsed repeatedly per run)"""
+    return urlparse(url).netloc.replace('www.', '')
+
+
 class CompleteWorkflowSuperScraper:
     """🚀 Complete workflow orchestrator - uses APIFY_TOKEN_1 for everything"""
     
@@ -130,7 +160,7 @@ class CompleteWorkflowSuperScraper:
                 print(f"💰 Using Full + email search mode with APIFY_TOKEN_1")
                 
                 # Extract domain for LinkedIn processing
-                domain = urlparse(normalized_url).netloc.replace('www.', '')
+                domain = _bare_domain(normalized_url)
                 verified_contacts = self.linkedin_scraper.scrape_linkedin_and_discover_emails(linkedin_url, domain)
                 
                 results['linkedin_employees'] = verified_contacts
@@ -144,7 +174,7 @@ class CompleteWorkflowSuperScraper:
                     results['verified_contacts'] = verified_contacts
             else:
                 print("❌ No LinkedIn URL found - triggering Smart Fallback")
-                domain = urlparse(normalized_url).netloc.replace('www.', '')
+                domain = _bare_domain(normalized_url)
                 verified_contacts = self._smart_fallback_workflow(website_staff, domain)
                 results['verified_contacts'] = verified_contacts
             
@@ -190,6 +220,15 @@ class CompleteWorkflowSuperScraper:
             print("❌ No website staff found for Smart Fallback")
             return []
         
+        # Drop repeated people up front - candidate emails derive from the
+        # name alone, so a duplicate would only re-spend verification credits
+        unique_staff = {}
+        for staff in website_staff:
+            key = name_key(staff.get('name', ''))
+            if key not in unique_staff:
+                unique_staff[key] = staff
+        website_staff = list(unique_staff.values())
+        
         print(f"👥 Website staff available for Smart Fallback: {len(website_staff)}")
         for staff in website_staff:
             print(f"   📋 {staff.get('name', 'Unknown')} - {staff.get('title', 'Unknown')}")
@@ -270,8 +309,10 @@ class CompleteWorkflowSuperScraper:
             print(f"🎯 Pattern discovered: {learned_pattern}")
             print("-" * 50)
             
-            remaining_staff = [s for s in scored_staff[1:] if s not in verified_contacts]  # Skip the first one we already tested
+            verified_ids = {id(s) for s in verified_contacts}
+            remaining_staff = [s for s in scored_staff[1:] if id(s) not in verified_ids]  # Skip the first one we already tested
             
+            candidates = []
             for staff in remaining_staff:
                 name = staff.get('name', '')
                 if not name or len(name.split()) < 2:
@@ -285,18 +326,25 @@ class CompleteWorkflowSuperScraper:
                 test_email = self._apply_learned_pattern(learned_pattern, first_name, last_name, domain)
                 
                 if test_email:
-                    print(f"   🧪 Testing learned pattern for {name}: {test_email}")
+                    candidates.append((staff, name, test_email))
+            
+            # Each check is an independent network round trip - run a few at once
+            with ThreadPoolExecutor(max_workers=max(1, min(4, len(candidates)))) as pool:
+                checks = list(pool.map(lambda c: self.millionverifier.smart_verify_email(c[2], domain), candidates))
+            
+            for (staff, name, test_email), is_valid in zip(candidates, checks):
+                print(f"   🧪 Testing learned pattern for {name}: {test_email}")
+                
+                if is_valid:
+                    print(f"   ✅ PATTERN SUCCESS: {name} - {test_email}")
                     
-                    if self.millionverifier.smart_verify_email(test_email, domain):
-                        print(f"   ✅ PATTERN SUCCESS: {name} - {test_email}")
-                        
-                        staff['email'] = test_email
-                        staff['email_source'] = 'learned_pattern'
-                        staff['fire_protection_score'] = self._score_fire_protection_relevance(staff.get('title', ''))
-                        staff['fire_protection_reason'] = self._get_fire_protection_reason(staff.get('title', ''))
-                        verified_contacts.append(staff)
-                    else:
-                        print(f"   ❌ Learned pattern failed for {name}: {test_email}")
+                    staff['email'] = test_email
+                    staff['email_source'] = 'learned_pattern'
+                    staff['fire_protection_score'] = self._score_fire_protection_relevance(staff.get('title', ''))
+                    staff['fire_protection_reason'] = self._get_fire_protection_reason(staff.get('title', ''))
+                    verified_contacts.append(staff)
+                else:
+                    print(f"   ❌ Learned pattern failed for {name}: {test_email}")
         
         print(f"\n🎉 SMART FALLBACK RESULTS:")
         print(f"   🧠 Pattern learned: {'Yes' if learned_pattern else 'No'}")
@@ -307,26 +355,12 @@ class CompleteWorkflowSuperScraper:
 
     def _calculate_fallback_priority(self, title: str, name: str) -> int:
         """🎯 Calculate priority for Smart Fallback testing"""
-        score = 0
-        title_lower = title.lower() if title else ''
-        name_lower = name.lower() if name else ''
-        
-        # Highest priority - Business owners and directors
-        if any(keyword in title_lower for keyword in ['owner', 'founder', 'director', 'managing director', 'ceo']):
-            score = 90
-        # High priority - Management
-        elif any(keyword in title_lower for keyword in ['manager', 'head', 'chief', 'lead']):
-            score = 75
-        # Medium priority - Specialists and coordinators
-        elif any(keyword in title_lower for keyword in ['specialist', 'coordinator', 'analyst']):
-            score = 50
-        # Lower priority - Support roles
-        elif any(keyword in title_lower for keyword in ['assistant', 'support', 'associate']):
-            score = 25
-        else:
-            score = 10
-        
-        return score
+        # Owners/directors > management > specialists > support roles
+        if title:
+            for tier, score in _FALLBACK_PRIORITY_TIERS:
+                if tier.search(title):
+                    return score
+        return 10
 
     def _extract_pattern_from_golden(self, email: str, first_name: str, last_name: str, domain: str) -> str:
         """🧠 Extract pattern from successful golden pattern email"""
@@ -386,36 +420,22 @@ class CompleteWorkflowSuperScraper:
         if not title:
             return 25
         
-        title_lower = title.lower()
-        
-        # Highest relevance - Direct responsibility
-        if any(keyword in title_lower for keyword in ['owner', 'director', 'managing']):
-            return 75
-        # High relevance - Management with decision authority
-        elif any(keyword in title_lower for keyword in ['manager', 'head', 'chief']):
-            return 65
-        # Medium relevance - Operational roles
-        elif any(keyword in title_lower for keyword in ['coordinator', 'specialist']):
-            return 45
+        # Direct responsibility > management authority > operational roles
+        for tier, score in _FIRE_RELEVANCE_TIERS:
+            if tier.search(title):
+                return score
         # Lower relevance - Support roles
-        else:
-            return 25
+        return 25
 
     def _get_fire_protection_reason(self, title: str) -> str:
         """🔥 Get reason for fire protection targeting"""
         if not title:
             return "General business contact"
         
-        title_lower = title.lower()
-        
-        if any(keyword in title_lower for keyword in ['owner', 'founder']):
-            return "Business owner - ultimate responsibility for fire safety compliance"
-        elif any(keyword in title_lower for keyword in ['director', 'managing']):
-            return "Senior management - budget authority for fire protection systems"
-        elif any(keyword in title_lower for keyword in ['manager', 'head']):
-            return "Management role - responsible for workplace safety procedures"
-        else:
-            return "Business contact - potential fire safety decision influence"
+        for tier, reason in _FIRE_REASON_TIERS:
+            if tier.search(title):
+                return reason
+        return "Business contact - potential fire safety decision influence"
 
     def _limit_and_deduplicate_contacts(self, contacts: list) -> list:
         """📊 Limit to max emails and remove duplicates"""
@@ -461,62 +481,70 @@ class CompleteWorkflowSuperScraper:
             print(f"❌ Failed to initialize email generator: {e}")
             return []
         
+        def generate(contact):
+            # Prepare company data for AI generation
+            company_data = {
+                'company_name': domain.replace('.com', '').replace('.co.uk', '').replace('.ie', '').title(),
+                'industry': 'business services',
+                'location': 'UK/Ireland',
+                'url': f"https://{domain}",
+                'services': ['business operations'],
+                'fire_safety_keywords': [],
+                'compliance_mentions': [],
+                'personalization_hooks': [contact.get('fire_protection_reason', 'Fire safety decision maker')],
+                'about_text': f"Company focusing on business operations with fire protection responsibilities"
+            }
+            
+            # Generate AI email
+            return email_generator.generate_expert_cold_email(
+                contact=contact,
+                company_data=company_data,
+                pfp_context={}
+            )
+        
         sent_emails = []
         
-        for i, contact in enumerate(verified_contacts, 1):
-            try:
-                print(f"\n📧 Generating email {i}/{len(verified_contacts)}: {contact['name']}")
-                
-                # Prepare company data for AI generation
-                company_data = {
-                    'company_name': domain.replace('.com', '').replace('.co.uk', '').replace('.ie', '').title(),
-                    'industry': 'business services',
-                    'location': 'UK/Ireland',
-                    'url': f"https://{domain}",
-                    'services': ['business operations'],
-                    'fire_safety_keywords': [],
-                    'compliance_mentions': [],
-                    'personalization_hooks': [contact.get('fire_protection_reason', 'Fire safety decision maker')],
-                    'about_text': f"Company focusing on business operations with fire protection responsibilities"
-                }
-                
-                # Generate AI email
-                email_content = email_generator.generate_expert_cold_email(
-                    contact=contact,
-                    company_data=company_data,
-                    pfp_context={}
-                )
-                
-                if email_content:
-                    print(f"   📧 Subject: {email_content['subject']}")
-                    print(f"   📄 Body length: {len(email_content['body'])} characters")
-                    
-                    # Send email to test address
-                    print(f"   📤 Sending to test email: {self.test_email}")
+        # Generate all emails concurrently up front; sending stays in contact
+        # order, so SMTP for one email overlaps the OpenAI calls for the next
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(verified_contacts)))) as pool:
+            pending = [pool.submit(generate, contact) for contact in verified_contacts]
+            
+            for i, (contact, future) in enumerate(zip(verified_contacts, pending), 1):
+                try:
+                    print(f"\n📧 Generating email {i}/{len(verified_contacts)}: {contact['name']}")
                     
-                    success = send_email(
-                        to_email=self.test_email,
-                        subject=email_content['subject'],
-                        body=email_content['body'],
-                        from_name="Dave - PFP Fire Protection"
-                    )
+                    email_content = future.result()
                     
-                    if success:
-                        print(f"✅ Test email sent successfully for {contact['name']}")
-                        contact['email_sent'] = True
-                        contact['subject'] = email_content['subject']
-                        contact['body'] = email_content['body']
-                        sent_emails.append(contact)
+                    if email_content:
+                        print(f"   📧 Subject: {email_content['subject']}")
+                        print(f"   📄 Body length: {len(email_content['body'])} characters")
+                        
+                        # Send email to test address
+                        print(f"   📤 Sending to test email: {self.test_email}")
+                        
+                        success = send_email(
+                            to_email=self.test_email,
+                            subject=email_content['subject'],
+                            body=email_content['body'],
+                            from_name="Dave - PFP Fire Protection"
+                        )
+                        
+                        if success:
+                            print(f"✅ Test email sent successfully for {contact['name']}")
+                            contact['email_sent'] = True
+                            contact['subject'] = email_content['subject']
+                            contact['body'] = email_content['body']
+                            sent_emails.append(contact)
+                        else:
+                            print(f"❌ Failed to send test email for {contact['name']}")
+                            contact['email_sent'] = False
                     else:
-                        print(f"❌ Failed to send test email for {contact['name']}")
+                        print(f"❌ Failed to generate email content for {contact['name']}")
                         contact['email_sent'] = False
-                else:
-                    print(f"❌ Failed to generate email content for {contact['name']}")
+                        
+                except Exception as e:
+                    print(f"❌ Error processing {contact['name']}: {e}")
                     contact['email_sent'] = False
-                    
-            except Exception as e:
-                print(f"❌ Error processing {contact['name']}: {e}")
-                contact['email_sent'] = False
         
         # Summary
         print(f"\n📊 EMAIL SENDING SUMMARY:")
@@ -527,8 +555,10 @@ class CompleteWorkflowSuperScraper:
         
         return sent_emails
 
-    def _normalize_url(self, url: str) -> str:
-        """🌐 Normalize URL format"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_url(url: str) -> str:
+        """🌐 Normalize URL format (memoized, pure)"""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
@@ -544,7 +574,7 @@ class CompleteWorkflowSuperScraper:
         os.makedirs("output", exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        domain = urlparse(results['website_url']).netloc.replace('www.', '').replace('.', '_')
+        domain = _bare_domain(results['website_url']).replace('.', '_')
         
         # Main results file
         main_filename = f"output/complete_workflow_{domain}_linkedin_pipeline_{timestamp}.csv"
@@ -5,6 +5,9 @@ import requests
 import os
 import time
 
+# One keep-alive session for all MillionVerifier calls
+_HTTP = requests.Session()
+
 def verify_email_millionverifier(email):
     """
     Verify email using MillionVerifier API
@@ -25,7 +28,7 @@ def verify_email_millionverifier(email):
     
     try:
         print(f"      📡 MillionVerifier checking: {email}")
-        response = requests.get(url, params=params, timeout=30)
+        response = _HTTP.get(url, params=params, timeout=30)
         
         if response.status_code == 200:
             result = response.json()
@@ -87,7 +90,7 @@ def get_millionverifier_balance():
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _HTTP.get(url, params=params, timeout=10)
         if response.status_code == 200:
             result = response.json()
             credits = result.get('credits', 0)
@@ -9,6 +9,7 @@ recon_actor.py
   and a scraping recommendation.
 """
 
+import os
 import sys
 import json
 import asyncio
@@ -17,6 +18,8 @@ from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright
 
+from scraper_common import RECON_CACHE_DIR, recon_cache_path
+
 # --- .env loader (override system env by default; kept for consistency) ---
 def _load_env_file(path: str = ".env") -> None:
     try:
@@ -260,4 +263,11 @@ if __name__ == "__main__":
         sys.exit(1)
     target = sys.argv[1]
     out = asyncio.run(run_recon(target))
+    if "error" not in out:
+        try:
+            os.makedirs(RECON_CACHE_DIR, exist_ok=True)
+            with open(recon_cache_path(target), "w", encoding="utf-8") as f:
+                json.dump(out, f)
+        except Exception:
+            pass
     print(json.dumps(out, indent=2))
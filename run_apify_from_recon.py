@@ -15,16 +15,22 @@ Full Scraper Runner (seed-only, sitemap-aware)
     cache_social_urls.txt
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
 import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Set
-from urllib.parse import urlparse, urljoin
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse, urljoin, urlunparse
 
 import requests
 
+from scraper_common import json_loads, orjson, recon_cache_path
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 
 # --- .env loader (override system env by default) ---
@@ -52,6 +58,8 @@ load_env_file()
 APIFY_TOKEN = ((os.getenv("APIFY_TOKEN") or "").strip().strip('"').strip("'"))
 APIFY_ACT_ID = (os.getenv("APIFY_ACT_ID") or "apify~web-scraper").strip()
 APIFY_PROXY_GROUPS = os.getenv("APIFY_PROXY_GROUP") or os.getenv("APIFY_PROXY_GROUPS")
+# Own upstream/rotating proxies (comma-separated); when set, Apify Proxy is not used
+APIFY_PROXY_URLS = [u.strip() for u in (os.getenv("APIFY_PROXY_URLS") or "").split(",") if u.strip()]
 
 # Toggles
 INCLUDE_SITEMAPS = os.getenv("INCLUDE_SITEMAPS", "0").lower() in ("1", "true", "yes")
@@ -62,6 +70,38 @@ MAX_DEPTH    = 0      # do not follow links
 REQUEST_RETRY = 1
 PAGELOAD_TIMEOUT = 20
 
+# Opt-in: identical actor inputs reuse the previous run's items for this many
+# seconds (default 0 = always crawl fresh)
+RUN_CACHE_DIR = os.path.join(HERE, ".apify_run_cache")
+RUN_CACHE_TTL = int(os.getenv("APIFY_RUN_CACHE_TTL", "0"))
+
+# Recon profiles written by recon_actor.py are reused for this long, so a
+# pipeline run does not load the site in a browser twice
+RECON_CACHE_TTL = int(os.getenv("RECON_CACHE_TTL", "3600"))
+
+# Recon profile in the child's stdout: a ```json fenced block if present,
+# else the outermost {...} span (log lines may surround it)
+JSON_OBJ_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.S)
+
+
+# One pooled keep-alive session for every Apify REST call in this run
+# (preflight, start, status polling, dataset pages) instead of a fresh
+# TCP/TLS handshake per request
+APIFY_HTTP = requests.Session()
+
+# Separate pooled session for the target site (robots.txt + sitemap levels)
+SITE_HTTP = requests.Session()
+
+
+def write_json(path: str, obj: Any, indent: bool = True) -> None:
+    """Write UTF-8 JSON (non-ASCII kept as-is), via orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2 if indent else None)
+
 
 def _mask(tok: str) -> str:
     if not tok:
@@ -76,7 +116,7 @@ def verify_apify_access(actor_id: str) -> None:
         raise SystemExit("APIFY_TOKEN missing. Put a full-access token in .env and re-run.")
 
     def get_me(path: str):
-        return requests.get(f"https://api.apify.com{path}", params={"token": token}, timeout=30)
+        return APIFY_HTTP.get(f"https://api.apify.com{path}", params={"token": token}, timeout=30)
 
     r = get_me("/v2/me")
     if r.status_code == 404:
@@ -101,7 +141,18 @@ def verify_apify_access(actor_id: str) -> None:
 
 
 def recon_profile(url: str) -> Dict[str, Any]:
-    """Run local recon_actor.py if present; otherwise minimal defaults."""
+    """Reuse a fresh cached recon profile, else run local recon_actor.py if present; otherwise minimal defaults."""
+    if RECON_CACHE_TTL > 0:
+        cached = recon_cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(cached) <= RECON_CACHE_TTL:
+                with open(cached, "rb") as f:
+                    prof = json_loads(f.read())
+                print("\n[Recon] Reusing cached profile")
+                return prof
+        except Exception:
+            pass
+
     recon_path = os.path.join(HERE, "recon_actor.py")
     if os.path.exists(recon_path):
         try:
@@ -109,11 +160,9 @@ def recon_profile(url: str) -> Dict[str, Any]:
             print("\n[Recon] Running…")
             p = subprocess.run([sys.executable, recon_path, url], cwd=HERE,
                                capture_output=True, text=True)
-            stdout = (p.stdout or "").strip()
-            first, last = stdout.find("{"), stdout.rfind("}")
-            if p.returncode == 0 and first != -1 and last != -1 and last > first:
-                blob = stdout[first:last+1]
-                prof = json.loads(blob)
+            m = JSON_OBJ_RE.search(p.stdout or "")
+            if p.returncode == 0 and m:
+                prof = json_loads(m.group(1) or m.group(2))
                 print(json.dumps(prof, indent=2))
                 return prof
         except Exception:
@@ -139,7 +188,7 @@ def parse_robots_for_sitemaps(base_url: str) -> List[str]:
     urls = []
     robots = urljoin(base_url, "/robots.txt")
     try:
-        r = requests.get(robots, timeout=15)
+        r = SITE_HTTP.get(robots, timeout=15)
         if r.status_code == 200:
             for line in r.text.splitlines():
                 if line.lower().startswith("sitemap:"):
@@ -151,11 +200,10 @@ def parse_robots_for_sitemaps(base_url: str) -> List[str]:
     return list(dict.fromkeys(urls))
 
 
-def parse_sitemap_xml(xml_text: str) -> List[str]:
-    """Return <loc> URLs from a sitemap or sitemap index."""
+def parse_sitemap_xml(xml_text) -> List[str]:
+    """Return <loc> URLs from a sitemap or sitemap index (str or raw bytes)."""
     locs: List[str] = []
     try:
-        import xml.etree.ElementTree as ET
         root = ET.fromstring(xml_text)
         for loc in root.findall(".//{*}loc"):
             if loc.text:
@@ -172,6 +220,15 @@ def same_host(u: str, host: str) -> bool:
         return False
 
 
+def canon_url(u: str) -> str:
+    """Canonical form for de-duplication: lowercase scheme/host, no fragment, no trailing slash."""
+    try:
+        p = urlparse(u.strip())
+        return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path.rstrip("/"), p.params, p.query, ""))
+    except Exception:
+        return u
+
+
 def discover_sitemap_urls(base_url: str, cap_total: int = 5000) -> List[str]:
     """Fetch /robots.txt and common sitemaps, flatten to a de-duplicated URL list (same-host only)."""
     host = urlparse(base_url).hostname
@@ -182,30 +239,41 @@ def discover_sitemap_urls(base_url: str, cap_total: int = 5000) -> List[str]:
     candidates.extend(parse_robots_for_sitemaps(base_url))
     candidates = list(dict.fromkeys(candidates))[:10]
 
-    # Fetch sitemap or sitemap index, then flatten
+    def fetch_locs(sm_url: str) -> List[str]:
+        try:
+            r = SITE_HTTP.get(sm_url, timeout=20)
+            if not (r.ok and "xml" in (r.headers.get("content-type","").lower())):
+                return []
+            # Raw bytes straight to expat - skips a full decode/re-encode
+            return parse_sitemap_xml(r.content)
+        except Exception:
+            return []
+
+    # Fetch sitemap or sitemap index, then flatten. Each level of the index
+    # tree is fetched in parallel - the requests are independent GETs.
     fetched: Set[str] = set()
-    queue = list(candidates)
+    level = list(candidates)
     try:
-        while queue and len(out) < cap_total:
-            sm_url = queue.pop(0)
-            if sm_url in fetched:
-                continue
-            fetched.add(sm_url)
-            try:
-                r = requests.get(sm_url, timeout=20)
-                if not (r.ok and "xml" in (r.headers.get("content-type","").lower())):
-                    continue
-                locs = parse_sitemap_xml(r.text)
-                # If this looks like a sitemap index, push children; else, collect page URLs
-                child_sitemaps = [u for u in locs if u.lower().endswith(".xml")]
-                if child_sitemaps:
-                    for u in child_sitemaps:
-                        if u not in fetched and len(queue) < 50:
-                            queue.append(u)
-                page_urls = [u for u in locs if not u.lower().endswith(".xml")]
-                out.extend(u for u in page_urls if same_host(u, host))
-            except Exception:
-                continue
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            while level and len(out) < cap_total:
+                level = [u for u in dict.fromkeys(level) if u not in fetched]
+                fetched.update(level)
+                next_level: List[str] = []
+                for locs in pool.map(fetch_locs, level):
+                    # If this looks like a sitemap index, push children; else, collect page URLs
+                    for u in locs:
+                        if u.lower().endswith(".xml"):
+                            if u not in fetched and len(next_level) < 50:
+                                next_level.append(u)
+                        elif same_host(u, host):
+                            out.append(u)
+                            if len(out) >= cap_total:
+                                break
+                    if len(out) >= cap_total:
+                        # Cap reached - no point scanning the rest of this batch
+                        next_level = []
+                        break
+                level = next_level
     except Exception:
         pass
 
@@ -215,9 +283,9 @@ def discover_sitemap_urls(base_url: str, cap_total: int = 5000) -> List[str]:
 
 
 # --- Actor pageFunction ---
-def build_page_function_js() -> str:
-    # Minimal metadata + SOCIALS + link harvest from seed page(s) only
-    return r"""
+# Minimal metadata + SOCIALS + link harvest from seed page(s) only.
+# Built once at import time; the string never varies between runs.
+PAGE_FUNCTION_JS = r"""
 async function pageFunction(context) {
   const { request, jQuery, customData } = context;
   const $ = jQuery;
@@ -258,14 +326,20 @@ async function pageFunction(context) {
     return u.includes("/company/") || u.includes("/school/") || u.includes("/showcase/");
   };
 
-  // --- Socials from anchors
+  // --- Socials from anchors (one targeted selector - only social links are visited)
   const socialSet = new Set();
-  document.querySelectorAll("a[href]").forEach(a => {
+  // The selector only narrows the scan; the parsed hostname decides (so
+  // "x.com" does not match mailto:info@fox.com or dropbox.com)
+  const isSocialHost = (hostname) => SOCIAL_HOSTS.some(h => hostname === h || hostname.endsWith("." + h));
+  const SOCIAL_SELECTOR = SOCIAL_HOSTS.map(h => `a[href*="${h}" i]`).join(",");
+  document.querySelectorAll(SOCIAL_SELECTOR).forEach(a => {
     const href = a.getAttribute("href");
     if (!href || /^(mailto:|tel:|javascript:)/i.test(href)) return;
     const abs = ABS(href);
     if (!abs) return;
-    if (SOCIAL_HOSTS.some(h => abs.includes(h))) socialSet.add(abs);
+    try {
+      if (isSocialHost(new URL(abs).hostname.toLowerCase())) socialSet.add(abs);
+    } catch(e) {}
   });
 
   // --- JSON-LD sameAs arrays
@@ -353,7 +427,7 @@ async function pageFunction(context) {
     links.social   = Array.from(new Set(links.social)).slice(0, 500);
   }
 
-  // Minimal page metadata
+  // Minimal page metadata (only sizes and headings cross the wire, never body text)
   const title = $('title').text().trim();
   const heading = $('h1').first().text().trim()
               || $('h2').first().text().trim()
@@ -363,7 +437,7 @@ async function pageFunction(context) {
     url: request.url,
     title,
     heading,
-    textLen: $('body').text().trim().length,
+    textLen: ((document.body && document.body.textContent) || "").trim().length,
     social: {
       by_platform: byPlatform,
       all: allSocial.sort(),
@@ -376,6 +450,10 @@ async function pageFunction(context) {
 """
 
 
+def build_page_function_js() -> str:
+    return PAGE_FUNCTION_JS
+
+
 def build_input_from_profile(profile: Dict[str, Any], collect_links: bool, max_requests: int) -> Dict[str, Any]:
     seeds = [{"url": profile["url"]}]
 
@@ -407,11 +485,14 @@ def build_input_from_profile(profile: Dict[str, Any], collect_links: bool, max_r
         "useStealth": True,
     }
 
-    if APIFY_PROXY_GROUPS:
+    if APIFY_PROXY_URLS:
+        input_payload["proxyConfiguration"] = {"useApifyProxy": False, "proxyUrls": APIFY_PROXY_URLS}
+    elif APIFY_PROXY_GROUPS:
         input_payload["proxyConfiguration"]["apifyProxyGroups"] = [APIFY_PROXY_GROUPS]
 
     print(f"\n[Full scraper] Building input from recon… (COLLECT_LINKS={'ON' if collect_links else 'OFF'}, INCLUDE_SITEMAPS={'ON' if INCLUDE_SITEMAPS else 'OFF'})")
-    print(json.dumps(input_payload, indent=2))
+    # Echo the input without the (large, constant) pageFunction source
+    print(json.dumps({**input_payload, "pageFunction": f"<{len(PAGE_FUNCTION_JS)} chars>"}, indent=2))
     return input_payload
 
 
@@ -423,7 +504,7 @@ def start_run(ws_input: Dict[str, Any]) -> Dict[str, Any]:
         if APIFY_TOKEN:
             headers["Authorization"] = f"Bearer {APIFY_TOKEN}"
             params["token"] = APIFY_TOKEN
-        return requests.post(url, json=ws_input, headers=headers, params=params, timeout=180)
+        return APIFY_HTTP.post(url, json=ws_input, headers=headers, params=params, timeout=180)
 
     r = try_start(APIFY_ACT_ID)
     if r.status_code in (401, 403):
@@ -460,7 +541,9 @@ def wait_for_finish(run_id: str, timeout_sec: int = 900, poll_secs: int = 3) ->
     print(f"[Apify] Live log : {log_url}\n")
 
     while True:
-        r = requests.get(f"{base}?token={APIFY_TOKEN}", timeout=60)
+        # Long-poll: Apify holds the request until the run finishes or 60s pass
+        polled_at = time.time()
+        r = APIFY_HTTP.get(base, params={"token": APIFY_TOKEN, "waitForFinish": 60}, timeout=90)
         r.raise_for_status()
         data = r.json()["data"]
         status = data.get("status", "UNKNOWN")
@@ -476,7 +559,9 @@ def wait_for_finish(run_id: str, timeout_sec: int = 900, poll_secs: int = 3) ->
             print("[Apify] Wait timeout reached — returning latest status.")
             return data
 
-        time.sleep(poll_secs)
+        # Only back off if the server answered immediately (no long-poll)
+        if time.time() - polled_at < poll_secs:
+            time.sleep(poll_secs)
 
 
 def fetch_dataset_items(dataset_id: str, limit_per_page: int = 1000, clean: bool = True) -> List[Dict[str, Any]]:
@@ -491,10 +576,10 @@ def fetch_dataset_items(dataset_id: str, limit_per_page: int = 1000, clean: bool
             "limit": limit_per_page,
         }
         url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
-        r = requests.get(url, params=params, timeout=120)
+        r = APIFY_HTTP.get(url, params=params, timeout=120)
         r.raise_for_status()
         try:
-            batch = r.json()
+            batch = json_loads(r.content)
         except ValueError:
             batch = []
         if not batch:
@@ -506,10 +591,37 @@ def fetch_dataset_items(dataset_id: str, limit_per_page: int = 1000, clean: bool
     return items
 
 
+def run_input_hash(payload: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_cached_run(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return dataset items from a previous identical run if still fresh."""
+    if RUN_CACHE_TTL <= 0:
+        return None
+    path = os.path.join(RUN_CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > RUN_CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            return json_loads(f.read())
+    except Exception:
+        return None
+
+
+def store_cached_run(key: str, items: List[Dict[str, Any]]) -> None:
+    if RUN_CACHE_TTL <= 0 or not items:
+        return
+    try:
+        os.makedirs(RUN_CACHE_DIR, exist_ok=True)
+        write_json(os.path.join(RUN_CACHE_DIR, f"{key}.json"), items, indent=False)
+    except Exception as e:
+        print(f"[Run cache] Could not store items: {e}")
+
+
 def save_caches(items: List[Dict[str, Any]], sitemap_urls: List[str], base_url: str) -> None:
     # Always save raw items
-    with open(os.path.join(HERE, "cache_items_full.json"), "w", encoding="utf-8") as f:
-        json.dump(items, f, ensure_ascii=False, indent=2)
+    write_json(os.path.join(HERE, "cache_items_full.json"), items)
 
     host = urlparse(base_url).hostname or ""
 
@@ -520,9 +632,18 @@ def save_caches(items: List[Dict[str, Any]], sitemap_urls: List[str], base_url:
     def push_soc(p: str, u: str):
         if not p or not u:
             return
+        # Same canonical key as the page links, so /company/x and /company/x/ collapse
+        u = canon_url(u)
         by_platform.setdefault(p, set()).add(u)
         flat.add(u)
 
+    # Single pass over items: socials, company LinkedIn candidates and links
+    # are all collected here rather than re-walking the item list per output
+    linkedin_cands: List[str] = []
+    internal: Set[str] = set()
+    external: Set[str] = set()
+    social:   Set[str] = set()
+
     for it in items:
         soc = (it or {}).get("social") or {}
         bp = soc.get("by_platform") or {}
@@ -539,6 +660,15 @@ def save_caches(items: List[Dict[str, Any]], sitemap_urls: List[str], base_url:
             elif isinstance(val, list):
                 for u in val:
                     push_soc(key, u)
+        cand = soc.get("linkedin_company") or None
+        if cand:
+            linkedin_cands.append(canon_url(cand))
+
+        # Canonicalize before the set insert so /team, /team/ and /team#x collapse
+        links = (it or {}).get("links") or {}
+        internal.update(canon_url(u) for u in (links.get("internal") or []) if isinstance(u, str))
+        external.update(canon_url(u) for u in (links.get("external") or []) if isinstance(u, str))
+        social.update(canon_url(u) for u in (links.get("social") or []) if isinstance(u, str))
 
     social_out = {
         "by_platform": {k: sorted(list(v)) for k, v in by_platform.items()},
@@ -546,37 +676,24 @@ def save_caches(items: List[Dict[str, Any]], sitemap_urls: List[str], base_url:
     }
     # Best company LinkedIn if any item had it
     ln = social_out["by_platform"].get("linkedin", [])
-    for it in items:
-        cand = (((it or {}).get("social") or {}).get("linkedin_company")) or None
-        if cand and cand not in ln:
+    for cand in dict.fromkeys(linkedin_cands):
+        if cand not in ln:
             ln.insert(0, cand)
     if ln:
         social_out["linkedin_company"] = ln[0]
 
-    with open(os.path.join(HERE, "site_social_links.json"), "w", encoding="utf-8") as f:
-        json.dump(social_out, f, ensure_ascii=False, indent=2)
-
-    # --- Collate LINKS: from seed pages (items) + from sitemaps ---
-    internal: Set[str] = set()
-    external: Set[str] = set()
-    social:   Set[str] = set()
-
-    # From items (seed pages)
-    for it in items:
-        links = (it or {}).get("links") or {}
-        for u in (links.get("internal") or []): internal.add(u)
-        for u in (links.get("external") or []): external.add(u)
-        for u in (links.get("social")   or []): social.add(u)
+    write_json(os.path.join(HERE, "site_social_links.json"), social_out)
 
+    # --- Collate LINKS: seed-page links gathered above + sitemaps ---
     # From sitemaps (merge without visiting)
     for u in sitemap_urls:
         try:
             if not isinstance(u, str):
                 continue
             if urlparse(u).hostname == host:
-                internal.add(u)
+                internal.add(canon_url(u))
             else:
-                external.add(u)
+                external.add(canon_url(u))
         except Exception:
             continue
 
@@ -585,13 +702,12 @@ def save_caches(items: List[Dict[str, Any]], sitemap_urls: List[str], base_url:
         "external": sorted(external),
         "social":   sorted(social),
     }
-    with open(os.path.join(HERE, "cache_urls_all.json"), "w", encoding="utf-8") as f:
-        json.dump(urls_all, f, ensure_ascii=False, indent=2)
+    write_json(os.path.join(HERE, "cache_urls_all.json"), urls_all)
 
     def write_list(path: str, seq: List[str]) -> None:
+        # One buffered write instead of a per-URL concat + write call
         with open(os.path.join(HERE, path), "w", encoding="utf-8") as f:
-            for u in seq:
-                f.write(u + "\n")
+            f.write("".join(f"{u}\n" for u in seq))
 
     write_list("cache_internal_urls.txt", urls_all["internal"])
     write_list("cache_external_urls.txt", urls_all["external"])
@@ -615,29 +731,48 @@ def main():
 
     profile = recon_profile(url)
 
-    # Discover sitemap URLs (cheap; not visited)
-    sitemap_urls: List[str] = []
-    if INCLUDE_SITEMAPS:
-        print("\n[Sitemaps] Discovering…")
-        sitemap_urls = discover_sitemap_urls(profile["url"], cap_total=5000)
-        print(f"[Sitemaps] Collected {len(sitemap_urls)} URL(s) from sitemaps.")
-
     # Build input and run
     max_requests = max(1, len((profile.get("startUrls") or [])) or 1)
     ws_input = build_input_from_profile(profile, collect_links=COLLECT_LINKS, max_requests=max_requests)
-
-    print("\n[Full scraper] Starting run…")
-    verify_apify_access(APIFY_ACT_ID)
-
-    run_data = start_run(ws_input)
-    final = wait_for_finish(run_data["id"], timeout_sec=900)
-    status = final.get("status")
-    print(f"\n[Full scraper] Status: {status}")
+    run_key = run_input_hash(ws_input)
+    cached_items = load_cached_run(run_key)
+
+    # Discover sitemap URLs (cheap; not visited) in the background while the
+    # actor runs — they are only merged into the caches afterwards.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        sitemap_future = None
+        if INCLUDE_SITEMAPS:
+            print("\n[Sitemaps] Discovering in background…")
+            sitemap_future = pool.submit(discover_sitemap_urls, profile["url"], 5000)
+
+        if cached_items is not None:
+            print(f"\n[Full scraper] Reusing {len(cached_items)} item(s) from an identical run (cache {run_key[:12]}).")
+            final: Dict[str, Any] = {}
+            status = "CACHED"
+        else:
+            print("\n[Full scraper] Starting run…")
+            verify_apify_access(APIFY_ACT_ID)
+
+            run_data = start_run(ws_input)
+            final = wait_for_finish(run_data["id"], timeout_sec=900)
+            status = final.get("status")
+            print(f"\n[Full scraper] Status: {status}")
+
+        sitemap_urls: List[str] = []
+        if sitemap_future is not None:
+            try:
+                sitemap_urls = sitemap_future.result()
+            except Exception:
+                sitemap_urls = []
+            print(f"[Sitemaps] Collected {len(sitemap_urls)} URL(s) from sitemaps.")
 
     dataset_id = final.get("defaultDatasetId")
     items: List[Dict[str, Any]] = []
-    if status == "SUCCEEDED" and dataset_id:
+    if cached_items is not None:
+        items = cached_items
+    elif status == "SUCCEEDED" and dataset_id:
         items = fetch_dataset_items(dataset_id)
+        store_cached_run(run_key, items)
         print("\n[Full scraper] Items preview:")
         print(json.dumps(items[:2], indent=2))
     else:
@@ -0,0 +1,117 @@
+"""
+🧰 Shared helpers for the scraper modules
+=========================================
+Logging setup used by every module that reports progress, so output does not
+depend on which module happened to be imported first, the on-disk GPT
+response cache shared by the website and LinkedIn scrapers, the OpenAI client
+they and the email generator use, and the recon profile cache location shared
+by recon_actor.py and run_apify_from_recon.py.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import time
+import unicodedata
+from typing import Optional
+from urllib.parse import urlparse, urlunparse
+
+try:  # optional: much faster JSON (de)serialization of cache files and replies
+    import orjson
+except ImportError:
+    orjson = None
+
+LOGGER_NAME = "smart_scraper"
+
+# GPT responses memoized on disk by sha256(model + prompt)
+GPT_CACHE_DIR = "output/gpt_cache"
+GPT_CACHE_TTL = 7 * 86400  # 7 days
+
+# The SDK retries 429/5xx/connection errors with jittered backoff (and honours
+# Retry-After) - a couple more attempts beats falling back to a worse path
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "4"))
+
+# Recon profiles saved per canonical URL, next to the scripts, so the crawl
+# step of a pipeline run reuses them instead of loading the site twice
+RECON_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".recon_cache")
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
+    """📝 Logger under "smart_scraper", configured once on first use.
+
+    Records are written synchronously to the same stdout main.py prints to, so
+    log lines and print output stay in order. SCRAPER_LOG_LEVEL=WARNING keeps
+    only warnings and errors.
+    """
+    base = logging.getLogger(LOGGER_NAME)
+    if not base.handlers:
+        console = logging.StreamHandler(sys.stdout)
+        console.setFormatter(logging.Formatter("%(message)s"))
+        base.addHandler(console)
+        base.setLevel(os.getenv("SCRAPER_LOG_LEVEL", "INFO").upper())
+        base.propagate = False
+    return logging.getLogger(name)
+
+
+@functools.lru_cache(maxsize=None)
+def openai_client(api_key: str):
+    """🧠 OpenAI client for this key, created on first use and shared (one connection pool)"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
+
+
+def name_key(name: str) -> str:
+    """👤 Canonical dedupe key for a person's name (case, spacing, accents and Unicode form)"""
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE_RE.sub(' ', stripped.casefold()).strip()
+
+
+def json_loads(data):
+    """Parse JSON from str/bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def gpt_cache_key(model: str, prompt: str) -> str:
+    """🔑 Cache key for one chat completion: sha256 of model + prompt"""
+    return hashlib.sha256((model + prompt).encode("utf-8")).hexdigest()
+
+
+def gpt_cache_load(model: str, prompt: str) -> Optional[dict]:
+    """💾 Cached {'ts', 'model', 'text'} entry for this prompt, stale or not (None if absent)"""
+    try:
+        with open(os.path.join(GPT_CACHE_DIR, f"{gpt_cache_key(model, prompt)}.json"), 'rb') as f:
+            entry = json_loads(f.read())
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) and 'text' in entry else None
+
+
+def gpt_cache_fresh(entry: Optional[dict]) -> bool:
+    """⏱️ True when a cache entry is younger than GPT_CACHE_TTL"""
+    return bool(entry) and time.time() - entry.get('ts', 0) <= GPT_CACHE_TTL
+
+
+def gpt_cache_store(model: str, prompt: str, text: str) -> None:
+    """💾 Save a chat completion; a failed write is logged, never raised"""
+    try:
+        os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(GPT_CACHE_DIR, f"{gpt_cache_key(model, prompt)}.json"), 'w', encoding='utf-8') as f:
+            json.dump({'ts': time.time(), 'model': model, 'text': text}, f)
+    except Exception as e:
+        get_logger().warning(f"   ⚠️ Could not cache GPT response: {e}")
+
+
+def recon_cache_path(url: str) -> str:
+    """Cache file for a URL (scheme + lowercased host + path, no trailing slash)."""
+    p = urlparse(url)
+    canon = urlunparse((p.scheme, p.netloc.lower(), p.path.rstrip("/"), "", "", ""))
+    return os.path.join(RECON_CACHE_DIR, hashlib.sha1(canon.encode("utf-8", errors="ignore")).hexdigest() + ".json")
@@ -21,6 +21,8 @@ from urllib.parse import urlparse
 
 import requests
 
+from scraper_common import json_loads, orjson
+
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 
@@ -56,7 +58,15 @@ load_env_file()  # load as early as possible
 
 
 
+# Pooled keep-alive session shared by start / status / dataset calls
+APIFY_HTTP = requests.Session()
+
+
 def proxy_config() -> Dict[str, Any]:
+    # Own upstream/rotating proxies (comma-separated) skip Apify Proxy and its markup
+    proxy_urls = [u.strip() for u in os.getenv("APIFY_PROXY_URLS", "").split(",") if u.strip()]
+    if proxy_urls:
+        return {"useApifyProxy": False, "proxyUrls": proxy_urls}
     conf: Dict[str, Any] = {"useApifyProxy": True}
     if APIFY_PROXY_GROUP:
         conf["apifyProxyGroups"] = [APIFY_PROXY_GROUP]
@@ -92,6 +102,8 @@ ANCHORS = [
 ]
 
 TEAM_KEYWORDS = re.compile(r"(team|people|staff|leadership|our-people|our-team|management|meet-the-team)", re.I)
+# Internal page URLs worth adding as staff candidates (plain substring match)
+STAFF_URL_KEYWORDS = re.compile(r"team|people|staff|leadership|management|about|who-we-are|company|board|directors|founders|meet", re.I)
 JUNK = re.compile(r"(privacy|cookie|terms|policy|sitemap|login|signup|register|account|cart|basket)", re.I)
 
 
@@ -142,34 +154,37 @@ def select_staff_urls(home, urls_all=None):
         "#crew", "#about", "#meet-the-team", "#our-people", "#the-team-behind-your-team",
         "#who-we-are", "#company", "#board", "#directors", "#founders"
     ]
-    candidates = [home_url] + [base + a for a in anchors]
-
-    # 3) Optionally include any internal pages that look staff-ish
+    def url_key(x):
+        # /team, /Team and /team/ all land on the same page
+        return x.lower().rstrip("/")
+
+    out = []
+    seen = set()
+    for u in [home_url] + [base + a for a in anchors]:
+        k = url_key(u)
+        if k not in seen:
+            seen.add(k)
+            out.append(u)
+
+    # 3) Optionally include any internal pages that look staff-ish - only
+    #    same-host pages not already covered by the injected candidates
+    host = urlparse(base).hostname
     if urls_all and isinstance(urls_all.get("internal"), list):
-        keywords = (
-            "team", "people", "staff", "leadership", "management", "about",
-            "who-we-are", "company", "board", "directors", "founders", "our-people",
-            "our-team", "meet"
-        )
         for u in urls_all["internal"]:
             if not isinstance(u, str):
                 continue
-            low = u.lower()
-            if any(k in low for k in keywords):
-                candidates.append(u.strip())
-
-    # 4) De-dupe and keep only same-host URLs
-    host = urlparse(base).hostname
-    seen, out = set(), []
-    for u in candidates:
-        if not u or not isinstance(u, str):
-            continue
-        try:
-            if urlparse(u).hostname == host and u not in seen:
+            if STAFF_URL_KEYWORDS.search(u):
+                u = u.strip()
+                k = url_key(u)
+                if not u or k in seen:
+                    continue
+                try:
+                    if urlparse(u).hostname != host:
+                        continue
+                except Exception:
+                    continue
                 out.append(u)
-                seen.add(u)
-        except Exception:
-            continue
+                seen.add(k)
 
     return out
 
@@ -244,18 +259,21 @@ POST_NAV_HOOK = r"""[
       });
     } catch (_) {}
 
-    // Scroll to anchor if any
+    // Scroll to each anchor batched onto this page (#team, #people, …)
     try {
-      let target = (request?.userData && request.userData.anchor) || "";
-      if (!target && request.url.includes("#")) {
-        target = request.url.split("#")[1] || "";
+      let targets = (request?.userData && request.userData.anchors) || [];
+      if (!targets.length && request?.userData?.anchor) targets = [request.userData.anchor];
+      if (!targets.length && request.url.includes("#")) {
+        targets = [request.url.split("#")[1] || ""];
       }
-      if (target) {
-        await page.evaluate((id) => {
+      for (const target of targets) {
+        if (!target) continue;
+        const found = await page.evaluate((id) => {
           const el = document.getElementById(id) || document.querySelector(`[name="${id}"]`);
           if (el) el.scrollIntoView({ behavior: 'instant', block: 'center' });
+          return !!el;
         }, target);
-        await sleep(400);
+        if (found) await sleep(400);
       }
     } catch (_) {}
 
@@ -394,9 +412,28 @@ async function pageFunction(context) {
       while (cur && cur !== document.body && ((cur.innerText || "").trim().length < 200)) cur = cur.parentElement;
       teamRootEl = cur || teamRootEl;
     }
+    const TEAM_HINT = /(the\s+team\s+behind\s+your\s+team|our\s+team|meet\s+the\s+team|our\s+people|leadership|management|expert team|behind the scenes)/i;
+    // Cheap selector pass before the innerText scan over every container: whole
+    // id/class tokens only ("team-grid", "staff_list" - not "teamwork"/"membership")
+    const TEAM_TOKEN = /(^|[-_])(team|staff|people)([-_]|$)/i;
+    let tokenRootEl = null;
+    if (!teamRootEl) {
+      let hintLen = 0, tokenLen = 0;
+      document.querySelectorAll('[id*="team" i], [id*="staff" i], [id*="people" i], [class*="team" i], [class*="staff" i], [class*="people" i]').forEach(el => {
+        const tokens = [el.id || "", ...Array.from(el.classList || [])];
+        if (!tokens.some(t => TEAM_TOKEN.test(t))) return;
+        const text = (el.innerText || "").trim();
+        const len = text.length;
+        if (len < 200 || len >= 20000) return;
+        if (TEAM_HINT.test(text)) {
+          if (len > hintLen) { teamRootEl = el; hintLen = len; }
+        } else if (len > tokenLen) {
+          tokenRootEl = el; tokenLen = len;
+        }
+      });
+    }
     let $teamRoot = teamRootEl ? $(teamRootEl) : null;
     if (!$teamRoot || !$teamRoot.length) {
-      const TEAM_HINT = /(the\s+team\s+behind\s+your\s+team|our\s+team|meet\s+the\s+team|our\s+people|leadership|management|expert team|behind the scenes)/i;
       const cands = $("section, article, main, div").filter((_, el) => TEAM_HINT.test((el.innerText || "").trim()));
       if (cands.length) {
         let best = null, bestLen = 0;
@@ -406,12 +443,13 @@ async function pageFunction(context) {
         });
         $teamRoot = best ? $(best) : $("body");
       } else {
-        $teamRoot = $("body");
+        $teamRoot = tokenRootEl ? $(tokenRootEl) : $("body");
       }
     }
 
-    // --- Visible text to parse
-    let teamText = clean(($teamRoot[0] && $teamRoot[0].innerText) || document.body.innerText || "");
+    // --- Visible text to parse (capped - a whole-body fallback can be huge)
+    const MAX_TEAM_TEXT = 150000;
+    let teamText = clean((($teamRoot[0] && $teamRoot[0].innerText) || document.body.innerText || "").slice(0, MAX_TEAM_TEXT));
     // Demote screaming ALL-CAPS hero words
     teamText = teamText.replace(/\b(THE|AND|OUR|YOUR|BEHIND|SCENES)\b/g, w => w.toLowerCase());
     out.debug.sampleText = teamText.slice(0, 1200);
@@ -570,10 +608,11 @@ async function pageFunction(context) {
     out.debug.counts.seqPairs = seqPairs;
 
     let microCount = 0;
-    $('[itemscope][itemtype*="schema.org/Person"]').each((_, el) => {
-      const $el = $(el);
-      const name = clean($el.find('[itemprop="name"]').first().text()) || ($el.attr('itemprop') === 'name' ? clean($el.text()) : "");
-      const job  = clean($el.find('[itemprop="jobTitle"],[itemprop="role"]').first().text());
+    // Native DOM walks - no jQuery wrapper per element
+    const textOf = (el) => (el && el.textContent) || "";
+    document.querySelectorAll('[itemscope][itemtype*="schema.org/Person"]').forEach((el) => {
+      const name = clean(textOf(el.querySelector('[itemprop="name"]'))) || (el.getAttribute('itemprop') === 'name' ? clean(textOf(el)) : "");
+      const job  = clean(textOf(el.querySelector('[itemprop="jobTitle"],[itemprop="role"]')));
       if (name) results.push({ name, title: job, _source: "microdata" });
       microCount++;
     });
@@ -590,8 +629,8 @@ async function pageFunction(context) {
       }
       for (const k in o) walkJSON(o[k]);
     }
-    $('script[type="application/ld+json"]').each((_, s) => {
-      const txt = $(s).text() || "";
+    document.querySelectorAll('script[type="application/ld+json"]').forEach((s) => {
+      const txt = textOf(s);
       try { const obj = JSON.parse(txt); walkJSON(obj); ldjsonBlocks++; } catch {}
     });
     out.debug.counts.ldjsonBlocks = ldjsonBlocks;
@@ -603,10 +642,9 @@ async function pageFunction(context) {
       [id*="team"] [class], [class*="team"],
       [id*="people"], [id*="staff"], [id*="leadership"], [class*="staff"], [class*="leadership"]
     `.replace(/\s+/g, " ");
-    $((teamRootEl || document.body)).find(CARD_SELECTOR).each((_, el) => {
-      const $el   = $(el);
-      const name  = clean($el.find('h2, h3, .name, [class*="name"], [itemprop="name"]').first().text());
-      const title = clean($el.find('.role, .title, [class*="title"], [class*="role"], [itemprop="jobTitle"]').first().text());
+    (teamRootEl || document.body).querySelectorAll(CARD_SELECTOR).forEach((el) => {
+      const name  = clean(textOf(el.querySelector('h2, h3, .name, [class*="name"], [itemprop="name"]')));
+      const title = clean(textOf(el.querySelector('.role, .title, [class*="title"], [class*="role"], [itemprop="jobTitle"]')));
       if (name) results.push({ name, title, _source: "domCard" });
       cardCount++;
     });
@@ -694,47 +732,65 @@ async function pageFunction(context) {
 
 # --------------------- Actor runner ---------------------
 
+# Static part of the staff-run input, built once at import
+STAFF_RUN_BASE: Dict[str, Any] = {
+    "useChrome": True,
+    "useStealth": True,
+    "ignoreHttpsErrors": True,
+    "injectJQuery": True,
+
+    # Navigation tolerances (SPA-friendly)
+    "waitUntil": ["networkidle2", "domcontentloaded"],
+    "navigationTimeoutSecs": 180,
+    "pageLoadTimeoutSecs": 180,
+
+    "maxDepth": 0,
+    "maxRequestRetries": 1,
+
+    "customData": {"readinessSelector": "body", "extraWaitMs": 600},
+
+    # Hooks/page function as STRINGS (Apify expects strings)
+    "preNavigationHooks": PRE_NAV_HOOK,
+    "postNavigationHooks": POST_NAV_HOOK,
+    "pageFunction": STAFF_PAGE_FUNCTION,
+
+    # ✅ keep fragments like #team in requests
+    "keepUrlFragments": True,
+}
+
+
 def start_staff_run(urls: List[str]) -> Dict[str, Any]:
     if not APIFY_TOKEN:
         raise RuntimeError("APIFY_TOKEN not set in environment (.env)")
 
-    # Preserve fragments and also pass them via userData.anchor
-    start_urls = []
+    # Batch fragment-only variants (/#team, /#people, …) of the same page into a
+    # single request: the page is loaded once and the post-navigation hook
+    # visits every anchor, instead of one full page load per fragment.
+    anchors_by_page: Dict[str, List[str]] = {}
     for u in urls:
-        anchor = ""
-        if "#" in u:
-            _, frag = u.split("#", 1)
-            anchor = frag.strip()
-        start_urls.append({"url": u, "uniqueKey": u, "userData": {"anchor": anchor}})
+        page_url, _, frag = u.partition("#")
+        anchors = anchors_by_page.setdefault(page_url, [])
+        frag = frag.strip()
+        if frag and frag not in anchors:
+            anchors.append(frag)
+
+    start_urls = []
+    for page_url, anchors in anchors_by_page.items():
+        start_urls.append({
+            "url": page_url,
+            "uniqueKey": page_url,
+            "userData": {"anchor": anchors[0] if anchors else "", "anchors": anchors},
+        })
 
     payload: Dict[str, Any] = {
+        **STAFF_RUN_BASE,
         "startUrls": start_urls,
-        "useChrome": True,
-        "useStealth": True,
-        "ignoreHttpsErrors": True,
-        "injectJQuery": True,
-
-        # Navigation tolerances (SPA-friendly)
-        "waitUntil": ["networkidle2", "domcontentloaded"],
-        "navigationTimeoutSecs": 180,
-        "pageLoadTimeoutSecs": 180,
-
         "maxRequestsPerCrawl": max(5, len(start_urls)),
-        "maxDepth": 0,
-        "maxRequestRetries": 1,
-
         "proxyConfiguration": proxy_config(),
-
-        "customData": {"readinessSelector": "body", "extraWaitMs": 600},
-
-        # Hooks/page function as STRINGS (Apify expects strings)
-        "preNavigationHooks": PRE_NAV_HOOK,
-        "postNavigationHooks": POST_NAV_HOOK,
-        "pageFunction": STAFF_PAGE_FUNCTION,
-
-        # ✅ keep fragments like #team in requests
-        "keepUrlFragments": True,
     }
+    # Encode once - the body is mostly the (large) page function source and is
+    # reused unchanged if the start falls back to apify~web-scraper
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
 
     def try_start(actor_id: str) -> requests.Response:
         url = f"https://api.apify.com/v2/acts/{actor_id}/runs"
@@ -743,7 +799,7 @@ def start_staff_run(urls: List[str]) -> Dict[str, Any]:
             "Authorization": f"Bearer {APIFY_TOKEN}",
         }
         params = {"token": APIFY_TOKEN}  # also send as query param
-        return requests.post(url, json=payload, headers=headers, params=params, timeout=180)
+        return APIFY_HTTP.post(url, data=body, headers=headers, params=params, timeout=180)
 
     actor = ACT_ID or "apify~web-scraper"
     r = try_start(actor)
@@ -768,8 +824,11 @@ def wait_for_run(run_id: str, timeout_sec: int = 600, poll_secs: int = 3) -> Dic
     print(f"\n[Apify] Live run : {console_url}")
     print(f"[Apify] Live log : {log_url}\n")
 
+    delay = 0.5
     while True:
-        r = requests.get(f"{base}?token={APIFY_TOKEN}", timeout=60)
+        # Long-poll: Apify holds the request until the run finishes or 60s pass
+        polled_at = time.time()
+        r = APIFY_HTTP.get(base, params={"token": APIFY_TOKEN, "waitForFinish": 60}, timeout=90)
         r.raise_for_status()
         data = r.json()["data"]
         status = data.get("status", "UNKNOWN")
@@ -785,7 +844,10 @@ def wait_for_run(run_id: str, timeout_sec: int = 600, poll_secs: int = 3) -> Dic
             print("[Apify] Wait timeout reached — returning latest status.")
             return data
 
-        time.sleep(poll_secs)
+        # Exponential backoff (0.5s → 8s) only when the server answered at once
+        if time.time() - polled_at < poll_secs:
+            time.sleep(delay)
+            delay = min(delay * 2, 8)
 
 
 def fetch_dataset_items(dataset_id: str, limit_per_page: int = 1000, clean: bool = True) -> List[Dict[str, Any]]:
@@ -800,10 +862,10 @@ def fetch_dataset_items(dataset_id: str, limit_per_page: int = 1000, clean: bool
             "limit": limit_per_page,
         }
         url = f"https://api.apify.com/v2/datasets/{dataset_id}/items"
-        r = requests.get(url, params=params, timeout=120)
+        r = APIFY_HTTP.get(url, params=params, timeout=120)
         r.raise_for_status()
         try:
-            batch = r.json()
+            batch = json_loads(r.content)
         except ValueError:
             batch = []
         if not batch:
@@ -5,8 +5,17 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 import ssl
+import re
 from datetime import datetime
 
+# Body formatting patterns (compiled once, not per email)
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+SENTENCE_RE = re.compile(r'\.([A-Z])')
+GREETING_RE = re.compile(r'(Hi [^,]+,)')
+CLOSING_RE = re.compile(r'([.!?])(\s*)(Best,|Regards,|Kind regards,)')
+SIGNATURE_RE = re.compile(r'([.!?])(\s*)(PFP|Fire Protection)')
+CONTACT_ICON_RE = re.compile(r'(\S)(📞|\🌐)')
+
 def send_email(to_email, subject, body, from_name="PFP Fire Protection"):
     """Send email via SMTP with proper formatting"""
     
@@ -58,28 +67,26 @@ def format_email_body(body):
     """
     Format email body with proper line breaks and spacing
     """
-    import re
-    
     # Remove any existing excessive line breaks
-    body = re.sub(r'\n{3,}', '\n\n', body)
+    body = EXTRA_NEWLINES_RE.sub('\n\n', body)
     
     # Ensure proper spacing after periods that end sentences
-    body = re.sub(r'\.([A-Z])', r'.\n\n\1', body)
+    body = SENTENCE_RE.sub(r'.\n\n\1', body)
     
     # Add line breaks after greeting
-    body = re.sub(r'(Hi [^,]+,)', r'\1\n\n', body)
+    body = GREETING_RE.sub(r'\1\n\n', body)
     
     # Add line breaks before "Best," or "Regards," 
-    body = re.sub(r'([.!?])(\s*)(Best,|Regards,|Kind regards,)', r'\1\n\n\2\3', body)
+    body = CLOSING_RE.sub(r'\1\n\n\2\3', body)
     
     # Add line breaks before signature section
-    body = re.sub(r'([.!?])(\s*)(PFP|Fire Protection)', r'\1\n\n\2\3', body)
+    body = SIGNATURE_RE.sub(r'\1\n\n\2\3', body)
     
     # Ensure proper spacing around phone numbers and websites
-    body = re.sub(r'(\S)(📞|\🌐)', r'\1\n\n\2', body)
+    body = CONTACT_ICON_RE.sub(r'\1\n\n\2', body)
     
     # Clean up any triple line breaks that might have been created
-    body = re.sub(r'\n{3,}', '\n\n', body)
+    body = EXTRA_NEWLINES_RE.sub('\n\n', body)
     
     return body.strip()
 
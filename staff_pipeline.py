@@ -91,6 +91,13 @@ SCRIPTS: List[Tuple[str, str]] = [
 
 STAFF_RESULTS_JSON = os.path.join(HERE, "staff_scrape_results.json")
 
+# URL canonicalization patterns, compiled once
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+_IPV4_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+
+# "Name — Title" fallback for free-text result items in the run summary
+_NAME_TITLE_LINE_RE = re.compile(r"^\s*([A-Z][A-Za-z\.'\- ]{1,60})\s+[—\-–]\s+(.+)$")
+
 
 def canonicalize_url(raw: str, force_www: bool = True, force_https: bool = True) -> str:
     """Normalize user input into a canonical homepage URL.
@@ -105,7 +112,7 @@ def canonicalize_url(raw: str, force_www: bool = True, force_https: bool = True)
     if not s:
         raise ValueError("Empty URL")
 
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", s):
+    if not _SCHEME_RE.match(s):
         s = "https://" + s
 
     p = urlparse(s)
@@ -117,7 +124,7 @@ def canonicalize_url(raw: str, force_www: bool = True, force_https: bool = True)
     if not host:
         raise ValueError(f"Invalid URL: {raw}")
 
-    is_ip = re.match(r"^\d{1,3}(?:\.\d{1,3}){3}$", host) is not None
+    is_ip = _IPV4_RE.match(host) is not None
 
     if force_www and not is_ip and not host.startswith("www.") and host.count(".") == 1:
         host = "www." + host
@@ -171,7 +178,9 @@ def summarize_results(path: str) -> None:
         if isinstance(v, (int, float)):
             return str(v)
         if isinstance(v, list):
-            return " ".join([norm(x) for x in v if norm(x)])
+            # normalize each element once (the filter used to re-run norm,
+            # doubling work at every level of nested lists)
+            return " ".join(s for s in map(norm, v) if s)
         if isinstance(v, dict):
             # try common text keys first
             for k in ("text", "value", "name", "title", "label"):
@@ -195,7 +204,7 @@ def summarize_results(path: str) -> None:
         # fallback: try to parse from a combined text line like "Name — Title"
         if not name and (m.get("text") or m.get("raw")):
             txt = norm(m.get("text") or m.get("raw"))
-            mt = re.search(r"^\s*([A-Z][A-Za-z\.'\- ]{1,60})\s+[—\-–]\s+(.+)$", txt)
+            mt = _NAME_TITLE_LINE_RE.search(txt)
             if mt:
                 name, title = mt.group(1).strip(), mt.group(2).strip()
 
@@ -20,8 +20,10 @@ PART 0 FILES CONSUMED (per domain):
 AUTOMATION: Each domain gets its own cache - no cross-contamination between targets
 """
 
-import json
+import functools
+import hashlib
 import os
+import re
 import subprocess
 import sys
 import time
@@ -29,6 +31,133 @@ from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 from typing import List, Dict, Any, Tuple
 
+import requests
+
+from scraper_common import get_logger, gpt_cache_fresh, gpt_cache_load, gpt_cache_store, json_loads, name_key, openai_client
+
+try:  # optional: linear-time RE2 engine for whole-page scans
+    import re2
+except ImportError:
+    re2 = None
+
+try:  # optional: measure the staff prompt in model tokens rather than characters
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Shared "smart_scraper" logger; SCRAPER_LOG_LEVEL=WARNING keeps only problems
+logger = get_logger()
+
+# Shared session for direct page fetches - reuses connections across lookups
+# instead of paying a new TCP/TLS handshake per request
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+
+# Upper bound on bytes read from a homepage during the manual LinkedIn search -
+# bloated marketing pages can run to several MB
+MANUAL_FETCH_MAX_BYTES = int(os.getenv("MANUAL_FETCH_MAX_BYTES", "500000"))
+
+# LinkedIn company links (with or without scheme/www, /company/ or /companies/).
+# Runs over whole homepages, so use RE2 (no backtracking) when it is installed.
+_LINKEDIN_COMPANY_RE = (re2 or re).compile(r'(?i)linkedin\.com/compan(?:y|ies)/([^"\s<>]+)')
+
+# Staff lines sent to GPT: collapse whitespace, drop page boilerplate picked up
+# as a "title", and cap title length (long bios add tokens, not accuracy)
+_WHITESPACE_RE = re.compile(r'\s+')
+_BOILERPLATE_RE = re.compile(r'cookie|privacy|terms of use|all rights reserved|©', re.IGNORECASE)
+MAX_TITLE_CHARS = 120
+
+# Character budget for the staff list in the validation prompt. GPT keeps at
+# most 15 people, so lines past this only add latency and cost.
+STAFF_PROMPT_BUDGET = int(os.getenv("STAFF_PROMPT_BUDGET", "6000"))
+# Same budget in tokens, used instead when tiktoken is installed
+STAFF_PROMPT_TOKENS = int(os.getenv("STAFF_PROMPT_TOKENS", "1500"))
+
+# Company names / generic page terms that disqualify a "person" name. One
+# compiled alternation = a single scan instead of 20 substring searches.
+_NAME_REJECT_RE = re.compile(
+    'company|ltd|limited|inc|corp|llc|team|department|group|services|solutions|'
+    'management|creative|exceptional|events|private|clients|home|about|contact|'
+    'page|crewsaders',
+    re.IGNORECASE,
+)
+
+# Part 0 cache files (and per-domain results held in memory) expire after this
+PART0_CACHE_TTL = int(os.getenv("PART0_CACHE_TTL", "86400"))  # 24 hours
+
+# Staff validation is a small classification task - mini is plenty
+VALIDATION_MODEL = os.getenv("OPENAI_VALIDATION_MODEL", "gpt-4o-mini")
+
+# Lists smaller than this that already pass the local name check skip GPT
+GPT_VALIDATION_MIN_STAFF = int(os.getenv("GPT_VALIDATION_MIN_STAFF", "4"))
+
+# Staff validation prompt - static text built once; filled per call with
+# format_map (the rendered text is also the GPT cache key, so keep it stable)
+_VALIDATION_PROMPT_TMPL = """Review and validate this staff list from {domain}.
+
+STAFF LIST:
+{staff}
+
+VALIDATION RULES:
+1. Keep ONLY real people (first + last name)
+2. Remove company names, services, or generic terms
+3. Improve job titles where possible
+4. Prioritize management, operations, and safety roles
+5. Return valid staff only
+
+Return as JSON: {{"staff": [{{"name": "Full Name", "title": "Job Title"}}]}}
+If no valid staff: {{"staff": []}}"""
+
+# Structured output schema for staff validation (root must be an object)
+_STAFF_SCHEMA = {
+    "name": "staff_list",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "staff": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "title": {"type": "string"},
+                    },
+                    "required": ["name", "title"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["staff"],
+        "additionalProperties": False,
+    },
+}
+
+
+def _clean_linkedin_url(url: str) -> str:
+    """🔗 One-pass LinkedIn URL cleanup: https, www host, no query/fragment/trailing slash"""
+    parsed = urlparse(url if '://' in url else 'https://' + url)
+    host = parsed.netloc.lower()
+    if host == 'linkedin.com' or host.endswith('.linkedin.com'):
+        host = 'www.linkedin.com'  # linkedin.com, uk.linkedin.com, ... all serve the same page
+    return urlunparse(('https', host, parsed.path.rstrip('/'), '', '', ''))
+
+
+@functools.lru_cache(maxsize=None)
+def _token_encoder(model: str):
+    """🔢 tiktoken encoding for a model, loaded once (None if unavailable)"""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
 
 class WebsiteScraper:
     """🌐 Enhanced website scraper with automatic domain-specific Part 0 integration"""
@@ -43,6 +172,12 @@ class WebsiteScraper:
         
         # Part 0 pipeline script
         self.staff_pipeline = self.script_dir / 'staff_pipeline.py'
+        
+        # GPT validation results keyed by prompt hash (same staff list = same answer)
+        self._validation_cache = {}
+        
+        # Final (staff, linkedin_url) per domain: {domain: (timestamp, staff, linkedin_url)}
+        self._domain_results = {}
     
     def _get_domain_cache_files(self, url: str) -> Dict[str, Path]:
         """🔧 AUTOMATIC: Generate domain-specific cache file paths"""
@@ -53,9 +188,12 @@ class WebsiteScraper:
         
         # Store current domain for logging
         self.current_domain = parsed.netloc.replace('www.', '')
+        dotless = self.current_domain.replace('.', '_')
         
-        # Create domain-specific cache file paths
+        # Create domain-specific cache file paths (built once per domain)
         return {
+            'internal_urls': self.script_dir / f'cache_internal_urls_{dotless}.txt',
+            'social_urls': self.script_dir / f'cache_social_urls_{dotless}.txt',
             'external_urls': self.script_dir / f'cache_external_urls_{domain}.txt',
             'social_links': self.script_dir / f'site_social_links_{domain}.json',
             'staff_results': self.script_dir / f'staff_scrape_results_{domain}.json',
@@ -66,9 +204,9 @@ class WebsiteScraper:
     def scrape_website_for_staff_and_linkedin(self, website_url: str) -> Tuple[List[Dict], str]:
         """📋 MAIN METHOD: Enhanced website scraping with automatic domain-specific Part 0 integration"""
         
-        print(f"🚀 ENHANCED WEBSITE MAPPING - PART 0 INTEGRATION")
-        print(f"🌐 Target: {website_url}")
-        print("=" * 60)
+        logger.info(f"🚀 ENHANCED WEBSITE MAPPING - PART 0 INTEGRATION")
+        logger.info(f"🌐 Target: {website_url}")
+        logger.info("=" * 60)
         
         # Normalize URL
         normalized_url = self._normalize_www(website_url)
@@ -77,44 +215,53 @@ class WebsiteScraper:
         self.cache_files = self._get_domain_cache_files(normalized_url)
         domain_name = self.current_domain
         
-        print(f"🗂️ Using domain-specific cache: {domain_name}")
-        print(f"   📁 Cache files: *_{domain_name.replace('.', '_')}.*")
+        logger.info(f"🗂️ Using domain-specific cache: {domain_name}")
+        logger.info(f"   📁 Cache files: *_{domain_name.replace('.', '_')}.*")
+        
+        # Repeat lead on a domain already analysed in this process - skip the
+        # cache file reload and GPT analysis entirely
+        cached = self._domain_results.get(domain_name)
+        if cached and time.time() - cached[0] <= PART0_CACHE_TTL:
+            _, cached_staff, cached_linkedin = cached
+            logger.info(f"♻️ Reusing analysis for {domain_name} ({len(cached_staff)} staff)")
+            return [dict(s) for s in cached_staff], cached_linkedin
         
         # PHASE 1: Ensure Part 0 data exists (domain-specific)
-        print(f"\n🔍 PHASE 1: PART 0 RECON DATA CHECK ({domain_name})")
-        print("-" * 40)
+        logger.info(f"\n🔍 PHASE 1: PART 0 RECON DATA CHECK ({domain_name})")
+        logger.info("-" * 40)
         
         part0_needs_refresh = self._check_part0_needs_refresh()
         
         if part0_needs_refresh:
-            print(f"📦 Part 0 data missing or incomplete for {domain_name} - running Part 0 pipeline...")
+            logger.info(f"📦 Part 0 data missing or incomplete for {domain_name} - running Part 0 pipeline...")
             success = self._run_part0_pipeline(normalized_url)
             if not success:
-                print("⚠️ Part 0 pipeline failed - using fallback extraction")
+                logger.warning("⚠️ Part 0 pipeline failed - using fallback extraction")
                 return self._basic_fallback_extraction(normalized_url)
         else:
-            print(f"✅ Part 0 cache files found and complete for {domain_name} - proceeding with analysis")
+            logger.info(f"✅ Part 0 cache files found and complete for {domain_name} - proceeding with analysis")
         
         # PHASE 2: Load Part 0 data (domain-specific)
-        print(f"\n📊 PHASE 2: LOADING PART 0 DATA ({domain_name})")
-        print("-" * 40)
+        logger.info(f"\n📊 PHASE 2: LOADING PART 0 DATA ({domain_name})")
+        logger.info("-" * 40)
         part0_data = self._load_part0_data()
         
         if not part0_data or not any(part0_data.values()):
-            print("❌ Failed to load Part 0 data - using basic fallback extraction")
+            logger.error("❌ Failed to load Part 0 data - using basic fallback extraction")
             return self._basic_fallback_extraction(normalized_url)
         
         # PHASE 3: Enhanced analysis using Part 0 data
-        print(f"\n🧠 PHASE 3: ENHANCED ANALYSIS WITH GPT-4O ({domain_name})")
-        print("-" * 40)
+        logger.info(f"\n🧠 PHASE 3: ENHANCED ANALYSIS WITH GPT-4O ({domain_name})")
+        logger.info("-" * 40)
         enhanced_staff = self._enhanced_staff_analysis(part0_data, normalized_url)
         linkedin_url = self._extract_linkedin_url(part0_data)
         
-        print(f"\n✅ ENHANCED WEBSITE SCRAPING COMPLETE:")
-        print(f"   🌐 Domain: {domain_name}")
-        print(f"   👥 Staff found: {len(enhanced_staff)}")
-        print(f"   🔗 LinkedIn URL: {linkedin_url if linkedin_url else 'None found'}")
+        logger.info(f"\n✅ ENHANCED WEBSITE SCRAPING COMPLETE:")
+        logger.info(f"   🌐 Domain: {domain_name}")
+        logger.info(f"   👥 Staff found: {len(enhanced_staff)}")
+        logger.info(f"   🔗 LinkedIn URL: {linkedin_url if linkedin_url else 'None found'}")
         
+        self._domain_results[domain_name] = (time.time(), [dict(s) for s in enhanced_staff], linkedin_url)
         return enhanced_staff, linkedin_url
     
     def _rename_generic_to_domain_specific(self):
@@ -124,8 +271,8 @@ class WebsiteScraper:
             'site_social_links.json': self.cache_files['social_links'],
             'staff_scrape_results.json': self.cache_files['staff_results'],
             'cache_external_urls.txt': self.cache_files['external_urls'],
-            'cache_internal_urls.txt': self.script_dir / f'cache_internal_urls_{self.current_domain.replace(".", "_")}.txt',
-            'cache_social_urls.txt': self.script_dir / f'cache_social_urls_{self.current_domain.replace(".", "_")}.txt',
+            'cache_internal_urls.txt': self.cache_files['internal_urls'],
+            'cache_social_urls.txt': self.cache_files['social_urls'],
             'cache_urls_all.json': self.cache_files['urls_all'],
             'cache_items_full.json': self.cache_files['items_full']
         }
@@ -139,14 +286,14 @@ class WebsiteScraper:
                 try:
                     # Rename generic file to domain-specific name
                     generic_path.rename(domain_path)
-                    print(f"   🔄 Renamed: {generic_name} → {domain_path.name}")
+                    logger.info(f"   🔄 Renamed: {generic_name} → {domain_path.name}")
                     renamed_count += 1
                 except Exception as e:
-                    print(f"   ⚠️ Failed to rename {generic_name}: {e}")
+                    logger.warning(f"   ⚠️ Failed to rename {generic_name}: {e}")
             else:
-                print(f"   ⚠️ Generic file not found: {generic_name}")
+                logger.warning(f"   ⚠️ Generic file not found: {generic_name}")
         
-        print(f"   ✅ Cache file renaming complete: {renamed_count} files renamed")
+        logger.info(f"   ✅ Cache file renaming complete: {renamed_count} files renamed")
         return renamed_count > 0
     
     def _check_part0_needs_refresh(self) -> bool:
@@ -155,7 +302,7 @@ class WebsiteScraper:
         # CRITICAL: Always run Part 0 if staff_scrape_results.json is missing
         staff_file = self.cache_files['staff_results']
         if not staff_file.exists():
-            print(f"   ❌ Missing critical file: {staff_file.name}")
+            logger.warning(f"   ❌ Missing critical file: {staff_file.name}")
             return True
         
         # Check essential files exist
@@ -165,30 +312,30 @@ class WebsiteScraper:
             file_path = self.cache_files[file_key]
             
             if not file_path.exists():
-                print(f"   ❌ Missing: {file_path.name}")
+                logger.warning(f"   ❌ Missing: {file_path.name}")
                 return True
             
-            # Cache expiry (24 hours)
+            # Cache expiry (PART0_CACHE_TTL, 24 hours by default)
             age_seconds = time.time() - file_path.stat().st_mtime
-            if age_seconds > 86400:  # 24 hours
-                print(f"   ⏰ Stale: {file_path.name} ({age_seconds/3600:.1f} hours old)")
+            if age_seconds > PART0_CACHE_TTL:
+                logger.info(f"   ⏰ Stale: {file_path.name} ({age_seconds/3600:.1f} hours old)")
                 return True
             
-            print(f"   ✅ Found: {file_path.name}")
+            logger.info(f"   ✅ Found: {file_path.name}")
         
         # Check if staff results file has content
         try:
-            with open(staff_file, 'r', encoding='utf-8') as f:
-                staff_data = json.load(f)
+            with open(staff_file, 'rb') as f:
+                staff_data = json_loads(f.read())
                 
             if not staff_data or not any(result.get('members', []) for result in staff_data):
-                print(f"   ⚠️ Empty staff results - forcing refresh")
+                logger.warning(f"   ⚠️ Empty staff results - forcing refresh")
                 return True
             
-            print(f"   ✅ Found: {staff_file.name} with data")
+            logger.info(f"   ✅ Found: {staff_file.name} with data")
             
         except Exception as e:
-            print(f"   ❌ Corrupted staff file: {e}")
+            logger.error(f"   ❌ Corrupted staff file: {e}")
             return True
         
         return False
@@ -197,14 +344,14 @@ class WebsiteScraper:
         """🚀 Run Part 0 pipeline to generate domain-specific cache files"""
         
         if not self.staff_pipeline.exists():
-            print(f"❌ Part 0 pipeline not found: {self.staff_pipeline}")
+            logger.error(f"❌ Part 0 pipeline not found: {self.staff_pipeline}")
             return False
         
         try:
-            print(f"   🚀 Running: python {self.staff_pipeline.name} {url}")
-            print(f"   📍 Working directory: {self.script_dir}")
-            print(f"   🗂️ Target cache: {self.current_domain}")
-            print(f"   🗺️ Sitemaps: ENABLED for complete URL discovery")
+            logger.info(f"   🚀 Running: python {self.staff_pipeline.name} {url}")
+            logger.info(f"   📍 Working directory: {self.script_dir}")
+            logger.info(f"   🗂️ Target cache: {self.current_domain}")
+            logger.info(f"   🗺️ Sitemaps: ENABLED for complete URL discovery")
             
             # Set environment with UTF-8 encoding for Windows
             env = os.environ.copy()
@@ -224,47 +371,47 @@ class WebsiteScraper:
             )
             
             if result.returncode == 0:
-                print(f"   ✅ Part 0 pipeline completed successfully")
+                logger.info(f"   ✅ Part 0 pipeline completed successfully")
                 
                 # Rename generic cache files to domain-specific names
-                print(f"   🔄 Renaming cache files to domain-specific names...")
+                logger.info(f"   🔄 Renaming cache files to domain-specific names...")
                 self._rename_generic_to_domain_specific()
                 
                 # Verify that domain-specific staff_scrape_results.json was created
                 if self.cache_files['staff_results'].exists():
-                    print(f"   ✅ Staff results file created successfully")
+                    logger.info(f"   ✅ Staff results file created successfully")
                     return True
                 else:
-                    print(f"   ⚠️ Part 0 completed but staff file missing - trying fallback")
+                    logger.warning(f"   ⚠️ Part 0 completed but staff file missing - trying fallback")
                     return self._run_part0_fallback(url)
                     
             else:
-                print(f"   ❌ Part 0 pipeline failed (exit code: {result.returncode})")
+                logger.error(f"   ❌ Part 0 pipeline failed (exit code: {result.returncode})")
                 if result.stderr:
-                    print(f"   📄 Error output: {result.stderr[:500]}")
+                    logger.warning(f"   📄 Error output: {result.stderr[:500]}")
                 
                 # Try fallback: run individual components
-                print(f"   🔄 Attempting fallback approach...")
+                logger.info(f"   🔄 Attempting fallback approach...")
                 return self._run_part0_fallback(url)
                 
         except subprocess.TimeoutExpired:
-            print(f"   ⏰ Part 0 pipeline timed out after 15 minutes")
+            logger.error(f"   ⏰ Part 0 pipeline timed out after 15 minutes")
             return False
         except Exception as e:
-            print(f"   ❌ Error running Part 0 pipeline: {e}")
-            print(f"   🔄 Attempting fallback approach...")
+            logger.error(f"   ❌ Error running Part 0 pipeline: {e}")
+            logger.info(f"   🔄 Attempting fallback approach...")
             return self._run_part0_fallback(url)
     
     def _run_part0_fallback(self, url: str) -> bool:
         """🔄 Fallback: Run Part 0 components individually"""
         
-        print(f"   🔄 FALLBACK: Running Part 0 components individually")
+        logger.info(f"   🔄 FALLBACK: Running Part 0 components individually")
         
         # Try to run just the essential recon components
         recon_script = self.script_dir / 'run_apify_from_recon.py'
         
         if not recon_script.exists():
-            print(f"   ❌ Recon script not found: {recon_script}")
+            logger.error(f"   ❌ Recon script not found: {recon_script}")
             return False
         
         try:
@@ -273,7 +420,7 @@ class WebsiteScraper:
             env['PYTHONIOENCODING'] = 'utf-8'
             env['INCLUDE_SITEMAPS'] = '1'  # Enable sitemaps for complete URL discovery
             
-            print(f"   🚀 Running recon component: {recon_script.name}")
+            logger.info(f"   🚀 Running recon component: {recon_script.name}")
             
             result = subprocess.run(
                 [sys.executable, str(recon_script), url],
@@ -287,12 +434,12 @@ class WebsiteScraper:
             )
             
             if result.returncode == 0:
-                print(f"   ✅ Recon component completed successfully")
+                logger.info(f"   ✅ Recon component completed successfully")
                 
                 # Try staff extraction if recon succeeded
                 staff_script = self.script_dir / 'select_and_scrape_staff.py'
                 if staff_script.exists():
-                    print(f"   🚀 Running staff component: {staff_script.name}")
+                    logger.info(f"   🚀 Running staff component: {staff_script.name}")
                     
                     staff_result = subprocess.run(
                         [sys.executable, str(staff_script), url],
@@ -306,48 +453,48 @@ class WebsiteScraper:
                     )
                     
                     if staff_result.returncode == 0:
-                        print(f"   ✅ Staff component completed successfully")
+                        logger.info(f"   ✅ Staff component completed successfully")
                         
                         # Rename generic cache files to domain-specific names
-                        print(f"   🔄 Renaming cache files to domain-specific names...")
+                        logger.info(f"   🔄 Renaming cache files to domain-specific names...")
                         self._rename_generic_to_domain_specific()
                         
                         return True
                     else:
-                        print(f"   ⚠️ Staff component failed, continuing with recon data")
+                        logger.warning(f"   ⚠️ Staff component failed, continuing with recon data")
                         
                         # Still rename available cache files
-                        print(f"   🔄 Renaming available cache files...")
+                        logger.info(f"   🔄 Renaming available cache files...")
                         self._rename_generic_to_domain_specific()
                         
                         return True  # Still return True as we have social links
                 
                 return True
             else:
-                print(f"   ❌ Recon component failed (exit code: {result.returncode})")
+                logger.error(f"   ❌ Recon component failed (exit code: {result.returncode})")
                 if result.stderr:
-                    print(f"   📄 Error: {result.stderr[:300]}")
+                    logger.warning(f"   📄 Error: {result.stderr[:300]}")
                 return False
                 
         except Exception as e:
-            print(f"   ❌ Fallback failed: {e}")
+            logger.error(f"   ❌ Fallback failed: {e}")
             return False
     
     def _basic_fallback_extraction(self, url: str) -> Tuple[List[Dict], str]:
         """🔄 Basic fallback when Part 0 completely fails"""
         
-        print(f"\n🔄 BASIC FALLBACK EXTRACTION")
-        print("-" * 40)
-        print(f"   🌐 Target: {url}")
+        logger.info(f"\n🔄 BASIC FALLBACK EXTRACTION")
+        logger.info("-" * 40)
+        logger.info(f"   🌐 Target: {url}")
         
         # Try to at least get LinkedIn URL manually
         linkedin_url = self._manual_linkedin_search(url)
         
         # Return empty staff list but try to provide LinkedIn URL
         if linkedin_url:
-            print(f"   ✅ Found LinkedIn URL via manual search: {linkedin_url}")
+            logger.info(f"   ✅ Found LinkedIn URL via manual search: {linkedin_url}")
         else:
-            print(f"   ❌ Could not find LinkedIn URL")
+            logger.warning(f"   ❌ Could not find LinkedIn URL")
         
         return [], linkedin_url
     
@@ -355,44 +502,37 @@ class WebsiteScraper:
         """🔍 Manual LinkedIn URL search as last resort"""
         
         try:
-            import requests
-            from urllib.parse import urljoin
+            logger.info(f"   🔍 Attempting manual LinkedIn search...")
             
-            print(f"   🔍 Attempting manual LinkedIn search...")
+            # Plain HTTP GET of the homepage - no actor run needed for one page.
+            # Streamed so at most MANUAL_FETCH_MAX_BYTES is ever held in memory.
+            with _HTTP.get(url, timeout=10, allow_redirects=True, stream=True) as response:
+                if response.status_code != 200:
+                    return ""
+                chunks, total = [], 0
+                for chunk in response.iter_content(8192):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= MANUAL_FETCH_MAX_BYTES:
+                        break
+                html = b"".join(chunks).decode(response.encoding or "utf-8", "ignore")
             
-            # Try to fetch homepage and look for LinkedIn links
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                content = response.text.lower()
-                
-                # Look for LinkedIn company URLs in the content
-                import re
-                linkedin_patterns = [
-                    r'https?://(?:www\.)?linkedin\.com/company/([^"\s<>]+)',
-                    r'https?://(?:www\.)?linkedin\.com/companies/([^"\s<>]+)',
-                    r'linkedin\.com/company/([^"\s<>]+)',
-                    r'linkedin\.com/companies/([^"\s<>]+)'
-                ]
-                
-                for pattern in linkedin_patterns:
-                    matches = re.findall(pattern, content)
-                    if matches:
-                        # Clean up the match and construct full URL
-                        company_id = matches[0].strip('/"\'')
-                        if '/' in company_id:
-                            company_id = company_id.split('/')[0]
-                        
-                        linkedin_url = f"https://www.linkedin.com/company/{company_id}"
-                        print(f"   ✅ Found LinkedIn pattern: {linkedin_url}")
-                        return linkedin_url
+            if html:
+                # Look for LinkedIn company URLs in the raw page (first hit wins,
+                # case-insensitive pattern - no lowered copy of the whole body)
+                match = _LINKEDIN_COMPANY_RE.search(html)
+                if match:
+                    # Clean up the match and construct full URL
+                    company_id = match.group(1).lower().strip('/"\'')
+                    if '/' in company_id:
+                        company_id = company_id.split('/')[0]
+                    
+                    linkedin_url = f"https://www.linkedin.com/company/{company_id}"
+                    logger.info(f"   ✅ Found LinkedIn pattern: {linkedin_url}")
+                    return linkedin_url
             
         except Exception as e:
-            print(f"   ⚠️ Manual search failed: {e}")
+            logger.warning(f"   ⚠️ Manual search failed: {e}")
         
         return ""
     
@@ -403,12 +543,12 @@ class WebsiteScraper:
         
         # Load social links (always needed for LinkedIn URL)
         try:
-            with open(self.cache_files['social_links'], 'r', encoding='utf-8') as f:
-                data['social_links'] = json.load(f)
+            with open(self.cache_files['social_links'], 'rb') as f:
+                data['social_links'] = json_loads(f.read())
                 platforms = len(data['social_links'].get('by_platform', {}))
-                print(f"   ✅ Loaded social links: {platforms} platforms")
+                logger.info(f"   ✅ Loaded social links: {platforms} platforms")
         except Exception as e:
-            print(f"   ❌ Failed to load social links: {e}")
+            logger.error(f"   ❌ Failed to load social links: {e}")
             data['social_links'] = {}
         
         # Load external URLs for GPT analysis
@@ -416,15 +556,15 @@ class WebsiteScraper:
             with open(self.cache_files['external_urls'], 'r', encoding='utf-8') as f:
                 urls = [line.strip() for line in f if line.strip()]
                 data['external_urls'] = urls
-                print(f"   ✅ Loaded external URLs: {len(urls)} URLs")
+                logger.info(f"   ✅ Loaded external URLs: {len(urls)} URLs")
         except Exception as e:
-            print(f"   ❌ Failed to load external URLs: {e}")
+            logger.error(f"   ❌ Failed to load external URLs: {e}")
             data['external_urls'] = []
         
         # Load staff extraction results (if available)
         try:
-            with open(self.cache_files['staff_results'], 'r', encoding='utf-8') as f:
-                staff_data = json.load(f)
+            with open(self.cache_files['staff_results'], 'rb') as f:
+                staff_data = json_loads(f.read())
                 data['staff_results'] = staff_data
                 
                 # Count total unique staff across all URLs
@@ -433,21 +573,21 @@ class WebsiteScraper:
                     for member in result.get('members', []):
                         name = member.get('name', '').strip()
                         if name and self._is_valid_person_name(name):
-                            unique_staff[name.lower()] = member
+                            unique_staff[name_key(name)] = member
                 
-                print(f"   ✅ Loaded staff results: {len(unique_staff)} unique staff found")
+                logger.info(f"   ✅ Loaded staff results: {len(unique_staff)} unique staff found")
         except Exception as e:
-            print(f"   ⚠️ No staff results found: {e}")
+            logger.warning(f"   ⚠️ No staff results found: {e}")
             data['staff_results'] = []
         
         # Load full items for content analysis (optional)
         try:
-            with open(self.cache_files['items_full'], 'r', encoding='utf-8') as f:
-                items_data = json.load(f)
+            with open(self.cache_files['items_full'], 'rb') as f:
+                items_data = json_loads(f.read())
                 data['items_full'] = items_data
-                print(f"   ✅ Loaded full items: {len(items_data)} items")
+                logger.info(f"   ✅ Loaded full items: {len(items_data)} items")
         except Exception as e:
-            print(f"   ⚠️ No full items found: {e}")
+            logger.warning(f"   ⚠️ No full items found: {e}")
             data['items_full'] = []
         
         return data
@@ -457,16 +597,16 @@ class WebsiteScraper:
         
         staff_from_part0 = self._extract_staff_from_part0(part0_data)
         
-        print(f"   📊 Part 0 staff extraction: {len(staff_from_part0)} staff members")
+        logger.info(f"   📊 Part 0 staff extraction: {len(staff_from_part0)} staff members")
         
         # If we have good staff from Part 0, validate and enhance them
         if staff_from_part0:
             enhanced_staff = self._validate_and_enhance_staff(staff_from_part0, domain)
-            print(f"   ✅ After validation: {len(enhanced_staff)} valid staff members")
+            logger.info(f"   ✅ After validation: {len(enhanced_staff)} valid staff members")
             return enhanced_staff
         
         # If no staff from Part 0, try GPT analysis of URLs
-        print(f"   🧠 No staff from Part 0 - trying GPT analysis of URLs")
+        logger.info(f"   🧠 No staff from Part 0 - trying GPT analysis of URLs")
         return self._gpt_analyze_urls_for_staff(part0_data, domain)
     
     def _extract_staff_from_part0(self, part0_data: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -488,7 +628,7 @@ class WebsiteScraper:
                 if not name or not self._is_valid_person_name(name):
                     continue
                 
-                name_key = name.lower()
+                name_key = name_key(name)
                 
                 # Keep the entry with the longest/best title
                 if name_key not in unique_staff or len(title) > len(unique_staff[name_key].get('title', '')):
@@ -501,67 +641,86 @@ class WebsiteScraper:
         return list(unique_staff.values())
     
     def _validate_and_enhance_staff(self, staff_list: List[Dict], domain: str) -> List[Dict[str, str]]:
-        """✅ Validate staff using GPT-4o and enhance with better titles"""
+        """✅ Validate staff using GPT (structured output) and enhance with better titles"""
         
         if not staff_list:
             return []
         
-        # Prepare staff data for GPT validation
-        staff_text = "\n".join([f"{s['name']} - {s['title']}" for s in staff_list])
-        
-        domain_clean = urlparse(f"https://{domain}").netloc.replace('www.', '')
-        
-        prompt = f"""Review and validate this staff list from {domain_clean}.
+        # Fast path: a handful of clean "First Last - Title" entries gains
+        # nothing from a model round trip
+        if len(staff_list) < GPT_VALIDATION_MIN_STAFF and all(
+            s.get('title') and self._is_valid_person_name(s.get('name', '')) for s in staff_list
+        ):
+            logger.info(f"   ⚡ {len(staff_list)} clean staff entries - skipping GPT validation")
+            return [{'name': s['name'], 'title': s['title'], 'source': 'part0_validated'} for s in staff_list]
+        
+        # Prepare staff data for GPT validation: cleaned, de-duplicated lines,
+        # built in one pass that stops as soon as the prompt budget is spent
+        enc = _token_encoder(VALIDATION_MODEL)
+        budget = STAFF_PROMPT_TOKENS if enc else STAFF_PROMPT_BUDGET
+        staff_lines, seen_lines, used = [], set(), 0
+        for s in staff_list:
+            title = _WHITESPACE_RE.sub(' ', s['title']).strip()
+            if _BOILERPLATE_RE.search(title):
+                title = ''
+            line = f"{_WHITESPACE_RE.sub(' ', s['name']).strip()} - {title[:MAX_TITLE_CHARS]}"
+            if line in seen_lines:
+                continue
+            used += (len(enc.encode(line)) if enc else len(line)) + 1
+            if used > budget and staff_lines:
+                break
+            seen_lines.add(line)
+            staff_lines.append(line)
+        staff_text = "\n".join(staff_lines)
+        
+        # Parsed once per scrape in _get_domain_cache_files; `domain` is the full URL
+        domain_clean = self.current_domain or urlparse(domain if '://' in domain else f"https://{domain}").netloc.replace('www.', '')
+        
+        prompt = _VALIDATION_PROMPT_TMPL.format_map({'domain': domain_clean, 'staff': staff_text})
 
-STAFF LIST:
-{staff_text}
-
-VALIDATION RULES:
-1. Keep ONLY real people (first + last name)
-2. Remove company names, services, or generic terms
-3. Improve job titles where possible
-4. Prioritize management, operations, and safety roles
-5. Return valid staff only
-
-Return as JSON: [{{"name": "Full Name", "title": "Job Title"}}]
-If no valid staff: []"""
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"   ♻️ GPT validation cache hit ({len(cached)} staff)")
+            return [dict(s) for s in cached]
 
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.openai_key)
+            result_text = None
+            disk_entry = gpt_cache_load(VALIDATION_MODEL, prompt)
+            if gpt_cache_fresh(disk_entry):
+                result_text = disk_entry['text']
+                logger.info(f"   💾 GPT validation disk cache hit ({VALIDATION_MODEL})")
             
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000,
-                temperature=0.1
-            )
+            if result_text is None:
+                response = openai_client(self.openai_key).chat.completions.create(
+                    model=VALIDATION_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=2000,
+                    temperature=0.1,
+                    response_format={"type": "json_schema", "json_schema": _STAFF_SCHEMA}
+                )
+                result_text = response.choices[0].message.content.strip()
+                gpt_cache_store(VALIDATION_MODEL, prompt, result_text)
             
-            result_text = response.choices[0].message.content.strip()
-            print(f"   🧠 GPT-4o validation complete ({len(result_text)} chars)")
-            print(f"   📝 GPT Response Preview: {result_text[:100]}...")
+            logger.info(f"   🧠 GPT validation complete ({VALIDATION_MODEL}, {len(result_text)} chars)")
+            logger.info(f"   📝 GPT Response Preview: {result_text[:100]}...")
             
-            # Parse JSON response
-            json_start = result_text.find('[')
-            json_end = result_text.rfind(']') + 1
+            # Structured output - the response is the JSON object itself
+            validated_staff = json_loads(result_text).get('staff', [])
             
-            if json_start >= 0 and json_end > json_start:
-                json_text = result_text[json_start:json_end]
-                validated_staff = json.loads(json_text)
-                
-                # Add source information and validate each entry
-                final_staff = []
-                for staff in validated_staff:
-                    if isinstance(staff, dict) and staff.get('name') and staff.get('title'):
-                        staff['source'] = 'part0_validated'
-                        final_staff.append(staff)
-                
-                return final_staff[:15]  # Limit to 15 staff
-            else:
-                print(f"   ⚠️ No valid JSON found in GPT response")
+            # Add source information and validate each entry
+            final_staff = []
+            for staff in validated_staff:
+                if isinstance(staff, dict) and staff.get('name') and staff.get('title'):
+                    staff['source'] = 'part0_validated'
+                    final_staff.append(staff)
+            
+            final_staff = final_staff[:15]  # Limit to 15 staff
+            self._validation_cache[cache_key] = final_staff
+            return [dict(s) for s in final_staff]
             
         except Exception as e:
-            print(f"   ⚠️ GPT validation failed: {e}")
+            logger.warning(f"   ⚠️ GPT validation failed: {e}")
         
         # Fallback: return original list with basic validation
         return [s for s in staff_list if self._is_valid_person_name(s.get('name', ''))][:10]
@@ -572,7 +731,7 @@ If no valid staff: []"""
         external_urls = part0_data.get('external_urls', [])
         
         if not external_urls:
-            print(f"   ❌ No external URLs available for analysis")
+            logger.warning(f"   ❌ No external URLs available for analysis")
             return []
         
         # Filter URLs that might contain staff information
@@ -585,7 +744,7 @@ If no valid staff: []"""
                 staff_urls.append(url)
         
         if not staff_urls:
-            print(f"   ❌ No staff-related URLs found")
+            logger.warning(f"   ❌ No staff-related URLs found")
             return []
         
         return []  # For now, return empty - could be enhanced to actually scrape these URLs
@@ -599,7 +758,8 @@ If no valid staff: []"""
         linkedin_url = social_links.get('linkedin_company', '')
         
         if linkedin_url:
-            print(f"   ✅ LinkedIn company URL: {linkedin_url}")
+            linkedin_url = _clean_linkedin_url(linkedin_url)
+            logger.info(f"   ✅ LinkedIn company URL: {linkedin_url}")
             return linkedin_url
         
         # Fallback to LinkedIn URLs in by_platform
@@ -610,24 +770,25 @@ If no valid staff: []"""
             # Prefer company URLs over individual profiles
             for url in linkedin_urls:
                 if '/company/' in url or '/companies/' in url:
-                    print(f"   ✅ LinkedIn company URL (from platform): {url}")
+                    url = _clean_linkedin_url(url)
+                    logger.info(f"   ✅ LinkedIn company URL (from platform): {url}")
                     return url
             
             # Fallback to first LinkedIn URL
-            linkedin_url = linkedin_urls[0]
-            print(f"   ✅ LinkedIn URL (fallback): {linkedin_url}")
+            linkedin_url = _clean_linkedin_url(linkedin_urls[0])
+            logger.info(f"   ✅ LinkedIn URL (fallback): {linkedin_url}")
             return linkedin_url
         
-        print(f"   ❌ No LinkedIn URL found in social links")
+        logger.warning(f"   ❌ No LinkedIn URL found in social links")
         return ""
     
     def _is_valid_person_name(self, name: str) -> bool:
         """✅ Validate if a name looks like a real person"""
         
-        if not name or len(name.strip()) < 3:
+        name = name.strip() if name else ''
+        if len(name) < 3:
             return False
         
-        name = name.strip()
         name_parts = name.split()
         
         # Must have at least first and last name
@@ -635,15 +796,7 @@ If no valid staff: []"""
             return False
         
         # Reject obvious company names or generic terms
-        reject_keywords = [
-            'company', 'ltd', 'limited', 'inc', 'corp', 'llc', 'team', 
-            'department', 'group', 'services', 'solutions', 'management',
-            'creative', 'exceptional', 'events', 'private', 'clients',
-            'home', 'about', 'contact', 'page', 'crewsaders'
-        ]
-        
-        name_lower = name.lower()
-        if any(keyword in name_lower for keyword in reject_keywords):
+        if _NAME_REJECT_RE.search(name):
             return False
         
         # Check if all parts look like name parts (start with capital)
@@ -653,19 +806,17 @@ If no valid staff: []"""
         
         return True
     
-    def _normalize_www(self, url: str) -> str:
-        """🌐 Normalize URL to include www if needed"""
+    @staticmethod
+    @functools.lru_cache(maxsize=10_000)
+    def _normalize_www(url: str) -> str:
+        """🌐 Normalize URL to include www if needed (memoized, pure)"""
         
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        parsed = urlparse(url)
-        netloc = parsed.netloc
-        
-        if netloc and not netloc.startswith('www.'):
-            netloc = 'www.' + netloc
-        
-        return urlunparse((
-            parsed.scheme, netloc, parsed.path, 
-            parsed.params, parsed.query, parsed.fragment
-        ))
\ No newline at end of file
+        # Host starts right after the scheme - insert www. there unless it is
+        # already present or the host is empty
+        i = url.index('://') + 3
+        if url.startswith('www.', i) or i == len(url) or url[i] in '/?#':
+            return url
+        return url[:i] + 'www.' + url[i:]
\ No newline at end of file